@@ -2,7 +2,7 @@ bl_info = {
     "name": "Blender MCP",
     "author": "xiguadaddy",
     "version": (0, 1, 0),
-    "blender": (3, 0, 0),
+    "blender": (3, 2, 0),
     "location": "View3D > Sidebar > MCP",
     "description": "Blender 的MCP集成工具",
     "category": "Interface",
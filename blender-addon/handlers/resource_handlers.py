@@ -1,6 +1,5 @@
 import bpy
 import json
-import bmesh
 from mathutils import Vector
 import base64
 import os
@@ -424,40 +423,55 @@ def handle_read_resource(resource_type, resource_id):
         result.contents.append(contents)
         return result.to_dict()
 
+# 网格资源中返回的顶点和面的最大数量
+_MESH_DATA_LIMIT = 100
+
 def extract_mesh_data(mesh_name):
     """提取网格对象数据"""
     obj = bpy.data.objects.get(mesh_name)
     if not obj or obj.type != 'MESH':
         return {"error": f"找不到网格对象: {mesh_name}"}
         
+    # NumPy只在读取网格资源时需要，延迟到调用时导入
+    import numpy as np
+    
     # 获取网格数据
     mesh = obj.data
+    verts = mesh.vertices
+    polys = mesh.polygons
+    vertices_count = len(verts)
+    faces_count = len(polys)
     
-    # 创建bmesh以获取更详细的信息
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.verts.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
+    # 用foreach_get一次性读取坐标和法线，避免逐顶点访问RNA属性
+    co = np.empty(vertices_count * 3, dtype=np.float32)
+    verts.foreach_get("co", co)
+    vert_normals = np.empty(vertices_count * 3, dtype=np.float32)
+    verts.foreach_get("normal", vert_normals)
     
-    # 提取顶点
-    vertices = []
-    for v in bm.verts:
-        vertices.append({
-            "co": [v.co.x, v.co.y, v.co.z],
-            "normal": [v.normal.x, v.normal.y, v.normal.z]
-        })
+    # 提取顶点（限制数据量）
+    vertices = [
+        {"co": c, "normal": n}
+        for c, n in zip(co.reshape(-1, 3)[:_MESH_DATA_LIMIT].tolist(),
+                        vert_normals.reshape(-1, 3)[:_MESH_DATA_LIMIT].tolist())
+    ]
     
-    # 提取面
-    faces = []
-    for f in bm.faces:
-        face_verts = [v.index for v in f.verts]
-        faces.append({
-            "verts": face_verts,
-            "normal": [f.normal.x, f.normal.y, f.normal.z]
-        })
+    # 面的顶点通过loop_start/loop_total在面拐角的顶点索引中切片得到
+    loop_start = np.empty(faces_count, dtype=np.int32)
+    polys.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(faces_count, dtype=np.int32)
+    polys.foreach_get("loop_total", loop_total)
+    face_normals = np.empty(faces_count * 3, dtype=np.float32)
+    polys.foreach_get("normal", face_normals)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
     
-    # 释放bmesh
-    bm.free()
+    # 提取面（限制数据量）
+    faces = [
+        {"verts": loop_verts[start:start + total].tolist(), "normal": n}
+        for start, total, n in zip(loop_start[:_MESH_DATA_LIMIT].tolist(),
+                                   loop_total[:_MESH_DATA_LIMIT].tolist(),
+                                   face_normals.reshape(-1, 3)[:_MESH_DATA_LIMIT].tolist())
+    ]
     
     # 收集材质信息
     materials = []
@@ -467,16 +481,29 @@ def extract_mesh_data(mesh_name):
     
     return {
         "name": obj.name,
-        "vertices_count": len(vertices),
-        "faces_count": len(faces),
+        "vertices_count": vertices_count,
+        "faces_count": faces_count,
         "location": [obj.location.x, obj.location.y, obj.location.z],
         "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
         "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
         "materials": materials,
-        "vertices": vertices[:100],  # 限制数据量
-        "faces": faces[:100],  # 限制数据量
+        "vertices": vertices,
+        "faces": faces,
     }
 
+def _find_principled_bsdf(node_tree):
+    """查找材质的原理化BSDF节点，优先沿材质输出节点的Surface连线查找"""
+    output = node_tree.get_output_node('ALL')
+    if output is not None:
+        surface = output.inputs.get("Surface")
+        if surface is not None and surface.is_linked:
+            node = surface.links[0].from_node
+            if node.type == 'BSDF_PRINCIPLED':
+                return node
+    
+    # 表面着色器不是原理化BSDF时，退回遍历全部节点
+    return next((n for n in node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+
 def extract_material_data(material_name):
     """提取材质数据"""
     mat = bpy.data.materials.get(material_name)
@@ -491,7 +518,7 @@ def extract_material_data(material_name):
     
     # 如果使用节点，提取一些基本属性
     if mat.use_nodes:
-        principled = next((n for n in mat.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        principled = _find_principled_bsdf(mat.node_tree)
         if principled:
             material_data["base_color"] = [
                 principled.inputs["Base Color"].default_value[0],
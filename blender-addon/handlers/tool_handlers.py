@@ -200,16 +200,17 @@ def set_uv_mapping(args):
     scale = args.get("scale", (1.0, 1.0))
     
     def exec_func():
+        obj = bpy.data.objects.get(object_name)
+        if not obj or obj.type != 'MESH':
+            return {"error": f"无效网格对象: {object_name}"}
+        
+        # 存储当前模式（直接读取目标对象的模式，不依赖上下文中的活动对象）
+        current_mode = obj.mode
+        
         try:
-            obj = bpy.data.objects.get(object_name)
-            if not obj or obj.type != 'MESH':
-                return {"error": f"无效网格对象: {object_name}"}
-            
             # 设置活动对象
             bpy.context.view_layer.objects.active = obj
             
-            # 存储当前模式
-            current_mode = bpy.context.object.mode
             bpy.ops.object.mode_set(mode='EDIT')
             
             # 选择所有面
@@ -257,8 +258,7 @@ def set_uv_mapping(args):
         except Exception as e:
             logger.error(f"设置UV映射时出错: {str(e)}")
             # 恢复模式
-            if 'current_mode' in locals():
-                bpy.ops.object.mode_set(mode=current_mode)
+            bpy.ops.object.mode_set(mode=current_mode)
             return {"error": str(e)}
             
     return execute_in_main_thread(exec_func)
@@ -2,12 +2,35 @@ import logging
 import json
 import traceback
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Type, Union
 
 from ..handler_base import RequestHandler
 from .serializer import MCPSerializer
 from ...mcp_types import Request, Result, CallToolResult
 
+# 尝试导入JSON Schema验证器（Blender自带的Python环境默认不包含）
+# 优先使用fastjsonschema，它会把模式编译为Python函数，比jsonschema的解释执行更快
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+try:
+    from jsonschema import Draft7Validator, ValidationError
+    HAS_JSONSCHEMA = True
+except ImportError:
+    HAS_JSONSCHEMA = False
+
+# 标记可使用预编译的模式验证器；都没有时，由各工具的validate_arguments自行检查参数
+HAS_SCHEMA_VALIDATOR = HAS_FASTJSONSCHEMA or HAS_JSONSCHEMA
+
+# 验证失败时可能抛出的异常类型（都带有message属性）
+_SCHEMA_ERRORS = (
+    ((fastjsonschema.JsonSchemaException,) if HAS_FASTJSONSCHEMA else ())
+    + ((ValidationError,) if HAS_JSONSCHEMA else ())
+)
+
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.ToolHandler")
 
@@ -17,22 +40,16 @@ class BaseToolHandler(ABC):
     所有工具处理器都应该继承此类
     """
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """工具名称"""
-        pass
-        
-    @property
-    def description(self) -> Optional[str]:
-        """工具描述"""
-        return None
-        
-    @property
-    @abstractmethod
-    def input_schema(self) -> Dict[str, Any]:
-        """工具输入模式"""
-        pass
+    # 按工具类缓存的预编译模式验证器
+    _schema_validators: Dict[type, Any] = {}
+    
+    # 工具元数据：子类可定义为类属性（注册表可直接读取，无需实例化），也可用property覆盖
+    # 工具名称
+    name: ClassVar[str]
+    # 工具描述
+    description: ClassVar[Optional[str]] = None
+    # 工具输入模式
+    input_schema: ClassVar[Dict[str, Any]]
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """
@@ -47,6 +64,34 @@ class BaseToolHandler(ABC):
         # 默认实现不进行验证
         return None
         
+    def validate_schema(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """
+        使用按类预编译的input_schema验证器验证参数
+        
+        Args:
+            arguments: 工具参数
+            
+        Returns:
+            如果验证失败，返回错误消息；验证通过或验证器不可用时返回None
+        """
+        if not HAS_SCHEMA_VALIDATOR:
+            return None
+            
+        validators = BaseToolHandler._schema_validators
+        validate = validators.get(type(self))
+        if validate is None:
+            if HAS_FASTJSONSCHEMA:
+                validate = fastjsonschema.compile(self.input_schema)
+            else:
+                validate = Draft7Validator(self.input_schema).validate
+            validators[type(self)] = validate
+            
+        try:
+            validate(arguments)
+        except _SCHEMA_ERRORS as e:
+            return e.message
+        return None
+        
     @abstractmethod
     def execute(self, arguments: Dict[str, Any]) -> Any:
         """
@@ -71,7 +116,22 @@ class BaseToolHandler(ABC):
     def create_result(self, content: List[Any], is_error: bool = False) -> CallToolResult:
         """创建工具调用结果对象"""
         return MCPSerializer.create_tool_result(content, is_error)
-        
+
+    def create_error_result(self, message: str, /, **kwargs: Any) -> CallToolResult:
+        """
+        创建错误结果对象
+
+        Args:
+            message: 错误消息，提供关键字参数时作为 str.format 模板
+            **kwargs: 模板参数
+
+        Returns:
+            标记为错误的工具调用结果
+        """
+        if kwargs:
+            message = message.format_map(kwargs)
+        return self.create_result([self.create_text_content(message)], is_error=True)
+
     def handle(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         处理工具调用
@@ -118,15 +178,21 @@ class ToolsRegistryMixin:
     
     def __init__(self):
         self._tools = {}
+        # 工具列表只在注册工具时变化，缓存后由register_tool使其失效
+        self._tools_list_cache: Optional[List[Dict[str, Any]]] = None
         
-    def register_tool(self, tool_handler: BaseToolHandler) -> None:
+    def register_tool(self, tool_handler: Union[BaseToolHandler, Type[BaseToolHandler]]) -> None:
         """
         注册工具处理器
         
         Args:
-            tool_handler: 工具处理器实例
+            tool_handler: 工具处理器实例，或工具处理器类（首次使用时再实例化）
         """
         try:
+            # name不是类属性的处理器类无法延迟实例化，直接创建实例
+            if isinstance(tool_handler, type) and not isinstance(tool_handler.name, str):
+                tool_handler = tool_handler()
+                
             tool_name = tool_handler.name
             logger.info(f"开始注册工具: {tool_name}")
             
@@ -134,6 +200,7 @@ class ToolsRegistryMixin:
                 logger.warning(f"工具 {tool_name} 已存在，将被覆盖")
                 
             self._tools[tool_name] = tool_handler
+            self._invalidate_tool_caches()
             logger.info(f"成功注册工具: {tool_name}, 当前工具总数: {len(self._tools)}")
             
             # 输出已注册工具列表，用于调试
@@ -154,23 +221,40 @@ class ToolsRegistryMixin:
         Returns:
             工具处理器实例，如果不存在则返回None
         """
-        return self._tools.get(name)
+        handler = self._tools.get(name)
+        if isinstance(handler, type):
+            # 以类注册的工具在首次使用时实例化并缓存
+            handler = self._tools[name] = handler()
+        return handler
+        
+    def _get_tool_attr(self, name: str, attr: str) -> Any:
+        """读取工具的描述性属性，类属性可直接读取时不实例化工具"""
+        value = getattr(self._tools[name], attr)
+        if isinstance(value, property):
+            value = getattr(self.get_tool(name), attr)
+        return value
+        
+    def _invalidate_tool_caches(self) -> None:
+        """工具集合变化后清除缓存的工具列表"""
+        self._tools_list_cache = None
         
     def list_tools(self) -> List[Dict[str, Any]]:
         """
         列出所有已注册工具
         
         Returns:
-            工具定义列表
-        """
-        tools = []
-        for name, handler in self._tools.items():
-            tools.append({
-                "name": name,
-                "description": handler.description,
-                "inputSchema": handler.input_schema
-            })
-        return tools
+            工具定义列表（缓存的列表，调用方不应修改）
+        """
+        if self._tools_list_cache is None:
+            self._tools_list_cache = [
+                {
+                    "name": name,
+                    "description": self._get_tool_attr(name, "description"),
+                    "inputSchema": self._get_tool_attr(name, "input_schema")
+                }
+                for name in self._tools
+            ]
+        return self._tools_list_cache
         
     def execute_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,23 @@
+"""
+batch工具模块
+"""
+
+from ....logger import get_logger
+
+logger = get_logger("BlenderMCP.BatchTools")
+
+# 记录加载日志
+logger.info("正在加载batch_tools包")
+
+# 导入工具模块，模块在导入时自行注册工具
+try:
+    from . import run_tools
+    logger.info("已导入工具模块: run_tools")
+except Exception as e:
+    logger.exception(f"导入工具模块 run_tools 时出错: {e}")
+
+# 导出工具映射，保持这个变量供其他模块导入
+# 但工具现在直接通过各个工具类中的注册代码注册到注册表
+tool_map = {}
+
+logger.info("batch_tools包加载完成")
@@ -0,0 +1,114 @@
+"""
+在一次主线程调用中依次执行多个工具的批量工具
+"""
+
+from ..registry import register_tool, get_tool_registry
+import logging
+from typing import Any, Dict, Optional
+
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
+from ....utils import thread_utils
+
+# 获取日志器
+logger = logging.getLogger("BlenderMCP.RunTools")
+
+class RunToolsHandler(BaseToolHandler):
+    """批量执行工具处理器"""
+
+    name = "mcp_blender_run_tools"
+    description = "按顺序执行多个工具调用，所有调用在同一次主线程调度中完成"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "title": "工具调用列表",
+                "description": "按顺序执行的工具调用，每项包含工具名称 tool 和参数 arguments",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {
+                            "type": "string",
+                            "minLength": 1
+                        },
+                        "arguments": {
+                            "type": "object"
+                        }
+                    },
+                    "required": ["tool"]
+                }
+            },
+            "stop_on_error": {
+                "type": "boolean",
+                "title": "出错时停止",
+                "description": "某个调用失败后是否跳过其余调用",
+                "default": False
+            }
+        },
+        "required": ["calls"]
+    }
+
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+
+        # 检查调用列表
+        calls = arguments.get("calls")
+        if not calls or not isinstance(calls, list):
+            return "必须提供至少一个工具调用"
+
+        for i, call in enumerate(calls):
+            if not isinstance(call, dict) or not call.get("tool"):
+                return f"第 {i + 1} 个调用必须提供工具名称"
+            if not isinstance(call.get("arguments", {}), dict):
+                return f"第 {i + 1} 个调用的参数必须是对象"
+
+        return None
+
+    def execute(self, arguments: Dict[str, Any]) -> Any:
+        """执行批量工具调用"""
+        logger.info("批量执行工具，参数: %s", arguments)
+
+        # 整批调用只进入一次主线程，其中各工具的主线程调度会直接执行
+        return thread_utils.run_in_main_thread(self._run_tools, arguments)
+
+    def _run_tools(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """在主线程中依次执行所有工具调用"""
+        calls = arguments.get("calls", [])
+        stop_on_error = arguments.get("stop_on_error", False)
+        registry = get_tool_registry()
+
+        content = []
+        failed = 0
+        # 批次结束时执行各工具登记的收尾操作（如延迟删除的布尔工具对象）
+        with thread_utils.batch_scope():
+            for i, call in enumerate(calls):
+                tool_name = call.get("tool")
+
+                # 不允许嵌套批量调用
+                handler = registry.get_tool(tool_name) if tool_name != self.name else None
+                if handler is None:
+                    result = self.create_error_result("找不到工具: {tool_name}", tool_name=tool_name)
+                else:
+                    result = handler.handle(call.get("arguments", {}))
+
+                is_error = result.get("isError", False)
+                content.append(self.create_text_content(f"[{i + 1}] {tool_name}: {'失败' if is_error else '成功'}"))
+                content.extend(result.get("content", []))
+
+                if is_error:
+                    failed += 1
+                    if stop_on_error:
+                        content.append(self.create_text_content(f"已跳过其余 {len(calls) - i - 1} 个调用"))
+                        break
+
+        # 任一调用失败时整体标记为错误
+        return self.create_result(content, is_error=bool(failed))
+
+
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(RunToolsHandler)
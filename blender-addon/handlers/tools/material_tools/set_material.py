@@ -1,7 +1,7 @@
 from ..registry import register_tool
 import bpy
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..base_tool_handler import BaseToolHandler
 from ....utils import thread_utils
@@ -9,6 +9,21 @@ from ....utils import thread_utils
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.SetMaterial")
 
+# Principled BSDF 输入插槽索引缓存（不同Blender版本插槽布局不同，首次使用时按名称解析）
+_BSDF_COLOR_IDX: Optional[int] = None
+_BSDF_METALLIC_IDX: Optional[int] = None
+_BSDF_ROUGHNESS_IDX: Optional[int] = None
+
+def _bsdf_input_indices(bsdf) -> Tuple[int, int, int]:
+    """返回 Base Color / Metallic / Roughness 在 Principled BSDF 输入中的索引"""
+    global _BSDF_COLOR_IDX, _BSDF_METALLIC_IDX, _BSDF_ROUGHNESS_IDX
+    if _BSDF_COLOR_IDX is None:
+        index = {socket.name: i for i, socket in enumerate(bsdf.inputs)}
+        _BSDF_COLOR_IDX = index["Base Color"]
+        _BSDF_METALLIC_IDX = index["Metallic"]
+        _BSDF_ROUGHNESS_IDX = index["Roughness"]
+    return _BSDF_COLOR_IDX, _BSDF_METALLIC_IDX, _BSDF_ROUGHNESS_IDX
+
 class SetMaterialHandler(BaseToolHandler):
     """设置材质工具处理器"""
     
@@ -83,7 +98,7 @@ class SetMaterialHandler(BaseToolHandler):
         
     def execute(self, arguments: Dict[str, Any]) -> Any:
         """执行设置材质操作"""
-        logger.info(f"设置材质，参数: {arguments}")
+        logger.info("设置材质，参数: %s", arguments)
         
         # 在主线程中执行Blender操作
         return thread_utils.run_in_main_thread(self._set_material, arguments)
@@ -96,23 +111,19 @@ class SetMaterialHandler(BaseToolHandler):
         metallic = arguments.get("metallic", 0.0)
         roughness = arguments.get("roughness", 0.5)
         
-        # 如果颜色只有RGB，添加Alpha通道
-        if len(color) == 3:
-            color.append(1.0)
+        # 如果颜色只有RGB，添加Alpha通道（使用本地元组，不修改调用方参数）
+        color = (*color, 1.0) if len(color) == 3 else tuple(color)
             
         # 获取对象
-        if object_name not in bpy.data.objects:
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
             error_msg = f"找不到对象: {object_name}"
             logger.error(error_msg)
-            error_content = self.create_text_content(error_msg)
-            return self.create_result([error_content], is_error=True)
-            
-        obj = bpy.data.objects[object_name]
+            return self.create_error_result(error_msg)
         
         # 获取或创建材质
-        if material_name in bpy.data.materials:
-            mat = bpy.data.materials[material_name]
-        else:
+        mat = bpy.data.materials.get(material_name)
+        if mat is None:
             mat = bpy.data.materials.new(name=material_name)
             
         # 确保材质使用节点
@@ -135,9 +146,11 @@ class SetMaterialHandler(BaseToolHandler):
         links.new(bsdf.outputs["BSDF"], output.inputs["Surface"])
         
         # 设置材质属性
-        bsdf.inputs["Base Color"].default_value = color
-        bsdf.inputs["Metallic"].default_value = metallic
-        bsdf.inputs["Roughness"].default_value = roughness
+        color_idx, metallic_idx, roughness_idx = _bsdf_input_indices(bsdf)
+        inputs = bsdf.inputs
+        inputs[color_idx].default_value = color
+        inputs[metallic_idx].default_value = metallic
+        inputs[roughness_idx].default_value = roughness
         
         # 应用材质到对象
         if obj.data.materials:
@@ -0,0 +1,78 @@
+"""
+网格工具共用的bmesh编辑函数
+
+单独的网格工具和批量编辑工具都通过这些函数修改网格，保证相同输入得到相同的几何结果。
+"""
+
+import bmesh
+import logging
+from typing import List, Optional, Sequence
+
+# 获取日志器
+logger = logging.getLogger("BlenderMCP.MeshTools")
+
+def _filter_indices(indices: List[int], count: int, kind: str) -> List[int]:
+    """去重并过滤超出范围的索引，并记录被丢弃的数量"""
+    unique = set(indices)
+    valid = [i for i in unique if 0 <= i < count]
+    dropped = len(unique) - len(valid)
+    if dropped:
+        logger.warning("忽略 %d 个超出范围的%s索引（共 %d 个%s）", dropped, kind, count, kind)
+    return valid
+
+def move_vertices(verts, idx, value: Sequence[float], absolute: bool) -> None:
+    """
+    逐顶点设置或偏移坐标，按分量修改以避免创建临时Vector
+
+    参数:
+        verts: 支持按索引访问的顶点序列（mesh.vertices 或已建立查找表的 bm.verts）
+        idx: 已去重且在范围内的顶点索引
+        value: 绝对位置或偏移量 [x, y, z]
+        absolute: 为True时设置为绝对位置，否则按偏移量移动
+    """
+    vx, vy, vz = value
+    for i in idx:
+        co = verts[i].co
+        if absolute:
+            co.x, co.y, co.z = vx, vy, vz
+        else:
+            co.x += vx
+            co.y += vy
+            co.z += vz
+
+def subdivide_bmesh(bm, edge_indices: Optional[List[int]], face_indices: Optional[List[int]],
+                    cuts: int, smoothness: float) -> int:
+    """
+    细分bmesh中指定的边，或指定面的全部边（都未指定时细分所有边）
+
+    参数取 bpy.ops.mesh.subdivide 的默认值（线性衰减、内顶点角、网格填充、允许n边形），
+    超出范围的索引会被忽略并记录警告。
+
+    返回:
+        被细分的边数
+    """
+    if edge_indices:
+        bm.edges.ensure_lookup_table()
+        edges = [bm.edges[i] for i in _filter_indices(edge_indices, len(bm.edges), "边")]
+    elif face_indices:
+        bm.faces.ensure_lookup_table()
+        faces = _filter_indices(face_indices, len(bm.faces), "面")
+        edges = list({e for i in faces for e in bm.faces[i].edges})
+    else:
+        edges = list(bm.edges)
+
+    if not edges:
+        raise ValueError("没有找到有效的边或面")
+
+    bmesh.ops.subdivide_edges(
+        bm,
+        edges=edges,
+        cuts=cuts,
+        smooth=smoothness,
+        smooth_falloff='LINEAR',
+        quad_corner_type='INNERVERT',
+        use_grid_fill=True,
+        use_single_edge=False,
+        use_only_quads=False
+    )
+    return len(edges)
@@ -13,6 +13,15 @@ from ....utils import thread_utils
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.CreateGeometryNodes")
 
+# 几何节点（Blender 2.92+）支持情况在运行期间不会变化，导入时检测一次
+_HAS_GEO_NODES = hasattr(bpy.types, "GeometryNodeTree")
+
+def _batch_link(node_group, pairs) -> None:
+    """批量创建节点连接，只解析一次 node_group.links"""
+    links = node_group.links
+    for from_socket, to_socket in pairs:
+        links.new(from_socket, to_socket)
+
 class CreateGeometryNodesHandler(BaseToolHandler):
     """创建几何节点工具处理器"""
     
@@ -73,7 +82,7 @@ class CreateGeometryNodesHandler(BaseToolHandler):
         
     def execute(self, arguments: Dict[str, Any]) -> Any:
         """执行创建几何节点操作"""
-        logger.info(f"创建几何节点，参数: {arguments}")
+        logger.info("创建几何节点，参数: %s", arguments)
         
         # 在主线程中执行Blender操作
         return thread_utils.run_in_main_thread(self._create_geometry_nodes, arguments)
@@ -86,17 +95,13 @@ class CreateGeometryNodesHandler(BaseToolHandler):
         parameters = arguments.get("parameters", {})
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 确保Blender版本支持几何节点
-        if bpy.app.version < (2, 92, 0):
-            text_content = self.create_text_content("几何节点功能需要Blender 2.92或更高版本")
-            return self.create_result([text_content], is_error=True)
+        if not _HAS_GEO_NODES:
+            return self.create_error_result("几何节点功能需要Blender 2.92或更高版本")
         
         try:
             # 创建新的几何节点修改器
@@ -119,7 +124,7 @@ class CreateGeometryNodesHandler(BaseToolHandler):
             # 根据节点类型添加特定节点
             if node_type == "simple":
                 # 简单节点组，只连接输入到输出
-                node_group.links.new(input_node.outputs[0], output_node.inputs[0])
+                _batch_link(node_group, [(input_node.outputs[0], output_node.inputs[0])])
                 
             elif node_type == "array":
                 # 创建阵列节点
@@ -135,9 +140,11 @@ class CreateGeometryNodesHandler(BaseToolHandler):
                 point_node.inputs[0].default_value = count
                 
                 # 连接节点
-                node_group.links.new(input_node.outputs[0], array_node.inputs[0])  # 实例化对象
-                node_group.links.new(point_node.outputs[0], array_node.inputs[2])  # 点阵列
-                node_group.links.new(array_node.outputs[0], output_node.inputs[0])  # 输出
+                _batch_link(node_group, [
+                    (input_node.outputs[0], array_node.inputs[0]),  # 实例化对象
+                    (point_node.outputs[0], array_node.inputs[2]),  # 点阵列
+                    (array_node.outputs[0], output_node.inputs[0]),  # 输出
+                ])
                 
             elif node_type == "instance":
                 # 创建实例化节点
@@ -153,10 +160,12 @@ class CreateGeometryNodesHandler(BaseToolHandler):
                 point_node.inputs[2].default_value = density
                 
                 # 连接节点
-                node_group.links.new(input_node.outputs[0], point_node.inputs[0])  # 输入几何体到点分布
-                node_group.links.new(input_node.outputs[0], instance_node.inputs[0])  # 输入几何体到实例化
-                node_group.links.new(point_node.outputs[0], instance_node.inputs[2])  # 分布的点到实例化
-                node_group.links.new(instance_node.outputs[0], output_node.inputs[0])  # 输出
+                _batch_link(node_group, [
+                    (input_node.outputs[0], point_node.inputs[0]),  # 输入几何体到点分布
+                    (input_node.outputs[0], instance_node.inputs[0]),  # 输入几何体到实例化
+                    (point_node.outputs[0], instance_node.inputs[2]),  # 分布的点到实例化
+                    (instance_node.outputs[0], output_node.inputs[0]),  # 输出
+                ])
                 
             elif node_type == "distribute":
                 # 创建点分布节点
@@ -168,8 +177,10 @@ class CreateGeometryNodesHandler(BaseToolHandler):
                 point_node.inputs[2].default_value = density
                 
                 # 连接节点
-                node_group.links.new(input_node.outputs[0], point_node.inputs[0])  # 输入几何体到点分布
-                node_group.links.new(point_node.outputs[0], output_node.inputs[0])  # 点到输出
+                _batch_link(node_group, [
+                    (input_node.outputs[0], point_node.inputs[0]),  # 输入几何体到点分布
+                    (point_node.outputs[0], output_node.inputs[0]),  # 点到输出
+                ])
                 
             elif node_type == "transform":
                 # 创建变换节点
@@ -194,13 +205,14 @@ class CreateGeometryNodesHandler(BaseToolHandler):
                 transform_node.inputs[3].default_value[2] = scale[2]
                 
                 # 连接节点
-                node_group.links.new(input_node.outputs[0], transform_node.inputs[0])  # 输入几何体到变换
-                node_group.links.new(transform_node.outputs[0], output_node.inputs[0])  # 变换到输出
+                _batch_link(node_group, [
+                    (input_node.outputs[0], transform_node.inputs[0]),  # 输入几何体到变换
+                    (transform_node.outputs[0], output_node.inputs[0]),  # 变换到输出
+                ])
             
             text_content = self.create_text_content(f"已为对象 '{object_name}' 创建 '{node_type}' 类型的几何节点修改器")
         except Exception as e:
-            text_content = self.create_text_content(f"创建几何节点时出错: {str(e)}")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"创建几何节点时出错: {str(e)}")
         
         # 返回结果
         return self.create_result([text_content])
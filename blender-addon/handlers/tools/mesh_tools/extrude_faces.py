@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional
 import mathutils
 
 from ..base_tool_handler import BaseToolHandler
-from ....utils import thread_utils
+from ....utils import blender_utils, thread_utils
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.ExtrudeFaces")
@@ -83,7 +83,7 @@ class ExtrudeFacesHandler(BaseToolHandler):
         
     def execute(self, arguments: Dict[str, Any]) -> Any:
         """执行挤出面操作"""
-        logger.info(f"挤出面，参数: {arguments}")
+        logger.info("挤出面，参数: %s", arguments)
         
         # 在主线程中执行Blender操作
         return thread_utils.run_in_main_thread(self._extrude_faces, arguments)
@@ -97,108 +97,103 @@ class ExtrudeFacesHandler(BaseToolHandler):
         individual = arguments.get("individual", False)
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 确保对象是网格类型
         if obj.type != 'MESH':
-            text_content = self.create_text_content(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
         
-        # 确保对象是活动对象
-        bpy.context.view_layer.objects.active = obj
+        me = obj.data
         
-        # 进入编辑模式
-        bpy.ops.object.mode_set(mode='EDIT')
+        # 对象模式下直接在独立的bmesh上挤出，无需进入编辑模式
+        if obj.mode == 'OBJECT':
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(me)
+                extruded_count = self._extrude_bmesh(bm, face_indices, distance, direction, individual)
+                if extruded_count:
+                    bm.to_mesh(me)
+                    me.update()
+            finally:
+                bm.free()
+        else:
+            # 缓存操作符引用，避免每次调用都重新遍历 bpy.ops 属性链
+            mode_set = bpy.ops.object.mode_set
+            
+            # 确保对象是活动对象
+            bpy.context.view_layer.objects.active = obj
+            
+            # 进入编辑模式
+            mode_set(mode='EDIT')
+            
+            try:
+                # 获取编辑网格的bmesh，退出上下文时同步到网格
+                with blender_utils.edit_bmesh(obj) as bm:
+                    extruded_count = self._extrude_bmesh(bm, face_indices, distance, direction, individual)
+            finally:
+                # 返回对象模式
+                mode_set(mode='OBJECT')
         
-        # 创建bmesh实例
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
+        # 检查是否有选中的面
+        if not extruded_count:
+            return self.create_error_result("没有找到要挤出的有效面")
         
-        # 取消所有选择
-        for face in bm.faces:
-            face.select = False
+        # 创建结果信息
+        if face_indices:
+            text_content = self.create_text_content(f"已挤出对象 '{object_name}' 上的 {extruded_count} 个面")
+        else:
+            text_content = self.create_text_content(f"已挤出对象 '{object_name}' 上的所有面")
         
-        # 选择指定的面
-        selected_faces = []
+        # 返回结果
+        return self.create_result([text_content])
         
+    def _extrude_bmesh(self, bm, face_indices: List[int], distance: float, direction: Optional[List[float]], individual: bool) -> int:
+        """在bmesh上挤出指定的面，返回挤出的面数"""
+        # 收集要挤出的面；extrude_face_region 直接接收 geom，无需逐面写入选择状态
         if face_indices:
-            for idx in face_indices:
-                if idx < len(bm.faces):
-                    face = bm.faces[idx]
-                    face.select = True
-                    selected_faces.append(face)
+            bm.faces.ensure_lookup_table()
+            faces = bm.faces
+            nfaces = len(faces)
+            selected_faces = [faces[idx] for idx in face_indices if 0 <= idx < nfaces]
         else:
-            # 如果没有提供面索引，选择所有面
-            for face in bm.faces:
-                face.select = True
-                selected_faces.append(face)
+            # 如果没有提供面索引，挤出所有面
+            selected_faces = list(bm.faces)
         
-        # 检查是否有选中的面
         if not selected_faces:
-            bpy.ops.object.mode_set(mode='OBJECT')  # 返回对象模式
-            text_content = self.create_text_content("没有找到要挤出的有效面")
-            return self.create_result([text_content], is_error=True)
+            return 0
+        
+        # 自定义方向的位移在所有面之间相同，只计算一次
+        direction_vec = mathutils.Vector(direction).normalized() * distance if direction else None
         
         # 执行挤出
         if individual:
             # 单独挤出每个面
             for face in selected_faces:
-                # 取消所有选择
-                for f in bm.faces:
-                    f.select = False
-                
-                # 只选择当前面
-                face.select = True
-                
                 # 执行挤出
                 ret = bmesh.ops.extrude_face_region(bm, geom=[face])
                 extruded_verts = [v for v in ret['geom'] if isinstance(v, bmesh.types.BMVert)]
                 
-                # 移动挤出的顶点
-                if direction:
-                    # 使用自定义方向
-                    vec = mathutils.Vector(direction).normalized() * distance
-                else:
-                    # 使用面法线
-                    vec = face.normal.normalized() * distance
-                
+                # 移动挤出的顶点（未指定方向时使用面法线）
+                vec = direction_vec if direction_vec is not None else face.normal.normalized() * distance
                 for v in extruded_verts:
                     v.co += vec
         else:
             # 作为一个组挤出
-            ret = bmesh.ops.extrude_face_region(bm, geom=[face for face in selected_faces])
-            extruded_verts = [v for v in ret['geom'] if isinstance(v, bmesh.types.BMVert)]
+            ret = bmesh.ops.extrude_face_region(bm, geom=selected_faces)
             
-            if direction:
+            if direction_vec is not None:
                 # 使用自定义方向
-                vec = mathutils.Vector(direction).normalized() * distance
-                for v in extruded_verts:
-                    v.co += vec
+                extruded_verts = [v for v in ret['geom'] if isinstance(v, bmesh.types.BMVert)]
+                if extruded_verts:
+                    bmesh.ops.translate(bm, vec=direction_vec, verts=extruded_verts)
             else:
                 # 使用单独的面法线
                 for face in [f for f in ret['geom'] if isinstance(f, bmesh.types.BMFace)]:
                     bmesh.ops.translate(bm, vec=face.normal * distance, verts=face.verts)
         
-        # 更新bmesh到网格
-        bmesh.update_edit_mesh(me)
-        
-        # 返回对象模式
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # 创建结果信息
-        if face_indices:
-            text_content = self.create_text_content(f"已挤出对象 '{object_name}' 上的 {len(selected_faces)} 个面")
-        else:
-            text_content = self.create_text_content(f"已挤出对象 '{object_name}' 上的所有面")
-        
-        # 返回结果
-        return self.create_result([text_content])
-
+        return len(selected_faces)
 
 # 在导入时自动注册工具实例
 register_tool(ExtrudeFacesHandler())
\ No newline at end of file
@@ -5,16 +5,39 @@
 import bpy
 from ..registry import register_tool
 import bmesh
+import itertools
 import logging
 from typing import Any, Dict, List, Optional
 import mathutils
 
 from ..base_tool_handler import BaseToolHandler
-from ....utils import thread_utils
+from ....utils import blender_utils, thread_utils
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.KnifeCut")
 
+def _all_geom(bm) -> list:
+    """一次性收集bmesh的全部面、边、顶点，避免切片后再拼接产生的临时列表"""
+    return list(itertools.chain(bm.faces, bm.edges, bm.verts))
+
+def _cut_plane_normal(object_points: List[mathutils.Vector]) -> mathutils.Vector:
+    """计算切割平面的单位法向量"""
+    if len(object_points) >= 3:
+        # 使用前三个点确定平面
+        v1, v2, v3 = object_points[0], object_points[1], object_points[2]
+        return (v2 - v1).cross(v3 - v1).normalized()
+    
+    # 创建一个垂直于直线的平面
+    direction = (object_points[1] - object_points[0]).normalized()
+    
+    # 寻找一个不与方向平行的向量，用于构建平面法向量
+    if abs(direction.x) < 0.5:
+        temp_vec = mathutils.Vector((1, 0, 0))
+    else:
+        temp_vec = mathutils.Vector((0, 1, 0))
+    
+    return direction.cross(temp_vec).normalized()
+
 class KnifeCutHandler(BaseToolHandler):
     """切刀工具处理器"""
     
@@ -77,7 +100,7 @@ class KnifeCutHandler(BaseToolHandler):
         
     def execute(self, arguments: Dict[str, Any]) -> Any:
         """执行切刀操作"""
-        logger.info(f"执行切刀操作，参数: {arguments}")
+        logger.info("执行切刀操作，参数: %s", arguments)
         
         # 在主线程中执行Blender操作
         return thread_utils.run_in_main_thread(self._knife_cut, arguments)
@@ -89,102 +112,88 @@ class KnifeCutHandler(BaseToolHandler):
         cut_through = arguments.get("cut_through", True)
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 确保对象是网格类型
         if obj.type != 'MESH':
-            text_content = self.create_text_content(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
+        
+        # 在对象空间中转换点坐标
+        object_points = [mathutils.Vector(point) for point in points]
+        me = obj.data
+        
+        # 对象模式下直接在独立的bmesh上切割，无需进入编辑模式
+        if obj.mode == 'OBJECT':
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(me)
+                message = self._bisect_points(bm, object_name, object_points)
+                bm.to_mesh(me)
+                me.update()
+            except Exception as e:
+                return self.create_error_result(f"执行切刀操作时出错: {str(e)}")
+            finally:
+                bm.free()
+            
+            return self.create_result([self.create_text_content(message)])
+        
+        # 缓存操作符引用，避免每次调用都重新遍历 bpy.ops 属性链
+        mode_set = bpy.ops.object.mode_set
         
         # 确保对象是活动对象
         bpy.context.view_layer.objects.active = obj
         
         # 进入编辑模式
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # 创建bmesh实例
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-        
-        # 在对象空间中转换点坐标
-        object_points = [mathutils.Vector(point) for point in points]
+        mode_set(mode='EDIT')
         
         # 尝试使用自定义的切刀操作
         try:
-            # 使用bmesh.ops.bisect_plane替代knife_cut
-            # 计算切割平面的法向量和位置
-            if len(object_points) >= 3:
-                # 如果有三个或更多点，使用前三个点确定平面
-                v1 = object_points[0]
-                v2 = object_points[1]
-                v3 = object_points[2]
-                
-                # 计算平面法向量
-                vec1 = v2 - v1
-                vec2 = v3 - v1
-                normal = vec1.cross(vec2).normalized()
-                
-                # 使用平面切割
-                result = bmesh.ops.bisect_plane(
-                    bm,
-                    geom=bm.faces[:] + bm.edges[:] + bm.verts[:],
-                    plane_co=v1,
-                    plane_no=normal,
-                    clear_inner=False,
-                    clear_outer=False
-                )
-                
-                # 更新网格
-                bmesh.update_edit_mesh(me)
-                
-                text_content = self.create_text_content(f"已在对象 '{object_name}' 上执行平面切割，使用 {len(points)} 个点确定的平面")
-            else:
-                # 如果只有两个点，创建一条直线切割
-                v1 = object_points[0]
-                v2 = object_points[1]
-                
-                # 创建一个垂直于直线的平面
-                direction = (v2 - v1).normalized()
-                
-                # 寻找一个不与方向平行的向量，用于构建平面法向量
-                if abs(direction.x) < 0.5:
-                    temp_vec = mathutils.Vector((1, 0, 0))
-                else:
-                    temp_vec = mathutils.Vector((0, 1, 0))
-                
-                # 计算平面法向量
-                normal = direction.cross(temp_vec).normalized()
-                
-                # 在每个点位置执行平面切割
-                for point in object_points:
-                    result = bmesh.ops.bisect_plane(
-                        bm,
-                        geom=bm.faces[:] + bm.edges[:] + bm.verts[:],
-                        plane_co=point,
-                        plane_no=normal,
-                        clear_inner=False,
-                        clear_outer=False
-                    )
-                
-                # 更新网格
-                bmesh.update_edit_mesh(me)
-                
-                text_content = self.create_text_content(f"已在对象 '{object_name}' 上执行线段切割，使用 {len(points)} 个点")
+            # 获取编辑网格的bmesh，退出上下文时同步到网格
+            with blender_utils.edit_bmesh(obj) as bm:
+                message = self._bisect_points(bm, object_name, object_points)
+            
+            text_content = self.create_text_content(message)
         except Exception as e:
-            text_content = self.create_text_content(f"执行切刀操作时出错: {str(e)}")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"执行切刀操作时出错: {str(e)}")
         finally:
             # 返回对象模式
-            bpy.ops.object.mode_set(mode='OBJECT')
+            mode_set(mode='OBJECT')
         
         # 返回结果
         return self.create_result([text_content])
-
+        
+    def _bisect_points(self, bm, object_name: str, object_points: List[mathutils.Vector]) -> str:
+        """使用bmesh.ops.bisect_plane在bmesh上执行切割，返回结果描述"""
+        # 计算平面法向量
+        normal = _cut_plane_normal(object_points)
+        
+        if len(object_points) >= 3:
+            # 如果有三个或更多点，使用前三个点确定的平面切割
+            bmesh.ops.bisect_plane(
+                bm,
+                geom=_all_geom(bm),
+                plane_co=object_points[0],
+                plane_no=normal,
+                clear_inner=False,
+                clear_outer=False
+            )
+            
+            return f"已在对象 '{object_name}' 上执行平面切割，使用 {len(object_points)} 个点确定的平面"
+        
+        # 如果只有两个点，在每个点位置执行平面切割（每次切割都会新增元素，需重新收集）
+        for point in object_points:
+            bmesh.ops.bisect_plane(
+                bm,
+                geom=_all_geom(bm),
+                plane_co=point,
+                plane_no=normal,
+                clear_inner=False,
+                clear_outer=False
+            )
+        
+        return f"已在对象 '{object_name}' 上执行线段切割，使用 {len(object_points)} 个点"
 
 # 在导入时自动注册工具实例
 register_tool(KnifeCutHandler())
\ No newline at end of file
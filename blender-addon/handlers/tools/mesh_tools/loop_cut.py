@@ -9,7 +9,7 @@ import logging
 import mathutils
 from typing import Any, Dict, List, Optional
 
-from ..base_tool_handler import BaseToolHandler
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
 from ....utils import thread_utils
 
 # 获取日志器
@@ -18,51 +18,55 @@ logger = logging.getLogger("BlenderMCP.LoopCut")
 class LoopCutHandler(BaseToolHandler):
     """环切工具处理器"""
     
-    @property
-    def name(self) -> str:
-        return "mcp_blender_loop_cut"
-        
-    @property
-    def description(self) -> Optional[str]:
-        return "在网格对象上执行环切操作"
-        
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "object_name": {
-                    "type": "string",
-                    "title": "对象名称",
-                    "description": "要操作的网格对象名称"
-                },
-                "edge_index": {
-                    "type": "integer",
-                    "title": "边索引",
-                    "description": "要从其开始环切的边索引"
-                },
-                "position": {
-                    "type": "number",
-                    "title": "位置",
-                    "description": "切割位置（0.0-1.0，0.5为中间）",
-                    "default": 0.5,
-                    "minimum": 0.0,
-                    "maximum": 1.0
-                },
-                "number_cuts": {
-                    "type": "integer",
-                    "title": "切割数量",
-                    "description": "要创建的环切数量",
-                    "default": 1,
-                    "minimum": 1,
-                    "maximum": 10
-                }
+    name = "mcp_blender_loop_cut"
+    description = "在网格对象上执行环切操作"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "object_name": {
+                "type": "string",
+                "title": "对象名称",
+                "description": "要操作的网格对象名称",
+                "minLength": 1
+            },
+            "edge_index": {
+                "type": "integer",
+                "title": "边索引",
+                "description": "要从其开始环切的边索引"
+            },
+            "position": {
+                "type": "number",
+                "title": "位置",
+                "description": "切割位置（0.0-1.0，0.5为中间）",
+                "default": 0.5,
+                "minimum": 0.0,
+                "maximum": 1.0
+            },
+            "number_cuts": {
+                "type": "integer",
+                "title": "切割数量",
+                "description": "要创建的环切数量",
+                "default": 1,
+                "minimum": 1,
+                "maximum": 10
             },
-            "required": ["object_name"]
-        }
+            "keep_mode": {
+                "type": "boolean",
+                "title": "保持编辑模式",
+                "description": "操作完成后保持编辑模式，便于连续调用多个网格工具时省去模式切换",
+                "default": False
+            }
+        },
+        "required": ["object_name"]
+    }
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
         # 检查对象名称
         if not arguments.get("object_name"):
             return "必须提供对象名称"
@@ -92,44 +96,47 @@ class LoopCutHandler(BaseToolHandler):
         edge_index = arguments.get("edge_index")
         position = arguments.get("position", 0.5)
         number_cuts = arguments.get("number_cuts", 1)
+        keep_mode = arguments.get("keep_mode", False)
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 确保对象是网格类型
         if obj.type != 'MESH':
-            text_content = self.create_text_content(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
+        
+        # 缓存操作符引用，避免每次调用都重新遍历 bpy.ops 属性链
+        mode_set = bpy.ops.object.mode_set
         
         # 确保对象是活动对象
         bpy.context.view_layer.objects.active = obj
         
-        # 进入编辑模式
-        bpy.ops.object.mode_set(mode='EDIT')
+        # 进入编辑模式（对象已处于编辑模式时跳过切换）
+        if obj.mode != 'EDIT':
+            mode_set(mode='EDIT')
         
         # 取消所有选择
         bpy.ops.mesh.select_all(action='DESELECT')
         
-        # 切换到边选择模式
-        bpy.context.tool_settings.mesh_select_mode = (False, True, False)
-        
-        # 创建bmesh实例
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-        
-        # 如果提供了边索引，选择该边
+        # 如果提供了边索引，选择该边（只有这一分支需要bmesh和边选择模式）
         if edge_index is not None:
-            if edge_index < 0 or edge_index >= len(bm.edges):
-                bpy.ops.object.mode_set(mode='OBJECT')  # 返回对象模式
-                text_content = self.create_text_content(f"边索引 {edge_index} 超出范围，对象 '{object_name}' 有 {len(bm.edges)} 条边")
-                return self.create_result([text_content], is_error=True)
+            # 切换到边选择模式
+            bpy.context.tool_settings.mesh_select_mode = (False, True, False)
+            
+            # 创建bmesh实例
+            me = obj.data
+            bm = bmesh.from_edit_mesh(me)
+            
+            edge_count = len(bm.edges)
+            if edge_index < 0 or edge_index >= edge_count:
+                if not keep_mode:
+                    mode_set(mode='OBJECT')  # 返回对象模式
+                return self.create_error_result(f"边索引 {edge_index} 超出范围，对象 '{object_name}' 有 {edge_count} 条边")
             
             # 选择边
+            bm.edges.ensure_lookup_table()
             bm.edges[edge_index].select = True
             bmesh.update_edit_mesh(me)
         
@@ -137,59 +144,8 @@ class LoopCutHandler(BaseToolHandler):
         try:
             # 尝试对选定的边执行环切
             if edge_index is not None:
-                # 需要使用鼠标位置设置环切工具，这在脚本中比较复杂
-                # 一种变通方法是使用细分操作，然后沿着边循环移动顶点
-                
-                # 获取选定的边
-                edge = bm.edges[edge_index]
-                
-                # 获取边循环
-                edge_loop = []
-                visited = set()
-                
-                def get_next_edge(current_edge, vert):
-                    """获取与当前边相连且形成循环的下一条边"""
-                    for link_edge in vert.link_edges:
-                        if link_edge != current_edge and link_edge not in visited:
-                            # 检查是否与当前边形成直线
-                            other_vert = link_edge.other_vert(vert)
-                            if len(other_vert.link_edges) == 4:  # 确保是网格内部顶点
-                                visited.add(link_edge)
-                                return link_edge
-                    return None
-                
-                # 从初始边开始
-                edge_loop.append(edge)
-                visited.add(edge)
-                
-                # 向一个方向循环
-                current_edge = edge
-                vert = edge.verts[0]
-                while True:
-                    next_edge = get_next_edge(current_edge, vert)
-                    if not next_edge or next_edge in edge_loop:
-                        break
-                    edge_loop.append(next_edge)
-                    vert = next_edge.other_vert(vert)
-                    current_edge = next_edge
-                
-                # 向另一个方向循环
-                current_edge = edge
-                vert = edge.verts[1]
-                while True:
-                    next_edge = get_next_edge(current_edge, vert)
-                    if not next_edge or next_edge in edge_loop:
-                        break
-                    edge_loop.append(next_edge)
-                    vert = next_edge.other_vert(vert)
-                    current_edge = next_edge
-                
-                # 选择边循环中的所有边
-                for e in edge_loop:
-                    e.select = True
-                
-                # 更新网格
-                bmesh.update_edit_mesh(me)
+                # 由选中的边在C中扩展出整条边循环，无需在Python中逐边遍历
+                bpy.ops.mesh.loop_multi_select(ring=False)
                 
                 # 执行细分操作
                 bpy.ops.mesh.subdivide(number_cuts=number_cuts)
@@ -228,15 +184,15 @@ class LoopCutHandler(BaseToolHandler):
                 
                 text_content = self.create_text_content(f"已在对象 '{object_name}' 上执行环切操作，切割数: {number_cuts}，位置: {position}")
         except Exception as e:
-            text_content = self.create_text_content(f"执行环切操作时出错: {str(e)}")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"执行环切操作时出错: {str(e)}")
         finally:
-            # 返回对象模式
-            bpy.ops.object.mode_set(mode='OBJECT')
+            # 返回对象模式（keep_mode 时保持编辑模式）
+            if not keep_mode:
+                mode_set(mode='OBJECT')
         
         # 返回结果
         return self.create_result([text_content])
 
 
-# 在导入时自动注册工具实例
-register_tool(LoopCutHandler())
\ No newline at end of file
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(LoopCutHandler)
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+在同一个bmesh上批量执行多个网格编辑的工具
+"""
+
+import bpy
+from ..registry import register_tool
+import bmesh
+import logging
+from typing import Any, Dict, Optional
+
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
+from ....utils import thread_utils
+from ._shared import move_vertices, subdivide_bmesh
+
+# 获取日志器
+logger = logging.getLogger("BlenderMCP.MeshBatch")
+
+# 支持的编辑类型
+_EDIT_TYPES = ("set_vertex", "subdivide")
+
+def _apply_set_vertex(bm, edit: Dict[str, Any]) -> str:
+    """在bmesh上设置或偏移顶点位置"""
+    indices = sorted({int(i) for i in edit.get("indices", [])})
+    position = edit.get("position")
+    offset = edit.get("offset")
+    relative = edit.get("relative", False)
+
+    if not indices:
+        raise ValueError("set_vertex 必须提供至少一个顶点索引")
+    if not position and not offset:
+        raise ValueError("set_vertex 必须提供位置或偏移参数")
+
+    bm.verts.ensure_lookup_table()
+    total_verts = len(bm.verts)
+    if indices[0] < 0 or indices[-1] >= total_verts:
+        raise ValueError(f"顶点索引超出范围，网格有 {total_verts} 个顶点")
+
+    # 与 mcp_blender_set_vertex_position 相同：未设置relative时position为绝对位置
+    value = position if position else offset
+    absolute = bool(position) and not relative
+    move_vertices(bm.verts, indices, value, absolute)
+
+    return f"移动 {len(indices)} 个顶点"
+
+def _apply_subdivide(bm, edit: Dict[str, Any]) -> str:
+    """在bmesh上细分指定的边或面（未指定时细分所有边）"""
+    cuts = edit.get("cuts", 1)
+    smoothness = edit.get("smoothness", 0.0)
+    edge_indices = edit.get("edges")
+    face_indices = edit.get("faces")
+
+    count = subdivide_bmesh(bm, edge_indices, face_indices, cuts, smoothness)
+    if edge_indices:
+        desc = f"{count} 条边"
+    elif face_indices:
+        desc = f"{count} 条面边"
+    else:
+        desc = "所有边"
+
+    return f"细分 {desc}，切割数: {cuts}"
+
+# 编辑类型到处理函数的映射
+_EDIT_HANDLERS = {
+    "set_vertex": _apply_set_vertex,
+    "subdivide": _apply_subdivide,
+}
+
+class MeshBatchHandler(BaseToolHandler):
+    """批量网格编辑工具处理器"""
+
+    name = "mcp_blender_mesh_batch"
+    description = "在同一网格上按顺序执行多个编辑（设置顶点位置、细分），只构建一次bmesh并只同步一次网格"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "object_name": {
+                "type": "string",
+                "title": "对象名称",
+                "description": "要操作的网格对象名称",
+                "minLength": 1
+            },
+            "edits": {
+                "type": "array",
+                "title": "编辑列表",
+                "description": "按顺序执行的编辑，每项的type为 set_vertex（indices, position/offset, relative）或 subdivide（edges/faces, cuts, smoothness）",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "type": {
+                            "type": "string",
+                            "enum": list(_EDIT_TYPES)
+                        },
+                        "indices": {
+                            "type": "array",
+                            "items": {"type": "integer"}
+                        },
+                        "position": {
+                            "type": "array",
+                            "items": {"type": "number"},
+                            "minItems": 3,
+                            "maxItems": 3
+                        },
+                        "offset": {
+                            "type": "array",
+                            "items": {"type": "number"},
+                            "minItems": 3,
+                            "maxItems": 3
+                        },
+                        "relative": {
+                            "type": "boolean",
+                            "default": False
+                        },
+                        "edges": {
+                            "type": "array",
+                            "items": {"type": "integer"}
+                        },
+                        "faces": {
+                            "type": "array",
+                            "items": {"type": "integer"}
+                        },
+                        "cuts": {
+                            "type": "integer",
+                            "default": 1,
+                            "minimum": 1,
+                            "maximum": 10
+                        },
+                        "smoothness": {
+                            "type": "number",
+                            "default": 0.0,
+                            "minimum": 0.0,
+                            "maximum": 1.0
+                        }
+                    },
+                    "required": ["type"]
+                }
+            }
+        },
+        "required": ["object_name", "edits"]
+    }
+
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+
+        # 检查对象名称
+        if not arguments.get("object_name"):
+            return "必须提供对象名称"
+
+        # 检查编辑列表
+        edits = arguments.get("edits")
+        if not edits or not isinstance(edits, list):
+            return "必须提供至少一个编辑"
+
+        for edit in edits:
+            if not isinstance(edit, dict) or edit.get("type") not in _EDIT_TYPES:
+                return f"编辑类型必须是: {', '.join(_EDIT_TYPES)}"
+
+        return None
+
+    def execute(self, arguments: Dict[str, Any]) -> Any:
+        """执行批量网格编辑"""
+        logger.info("批量网格编辑，参数: %s", arguments)
+
+        # 在主线程中执行Blender操作
+        return thread_utils.run_in_main_thread(self._mesh_batch, arguments)
+
+    def _mesh_batch(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """在主线程中依次执行所有编辑"""
+        object_name = arguments.get("object_name")
+        edits = arguments.get("edits", [])
+
+        # 检查对象是否存在
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
+
+        # 确保对象是网格类型
+        if obj.type != 'MESH':
+            return self.create_error_result(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
+
+        me = obj.data
+        in_edit_mode = obj.mode == 'EDIT'
+
+        # 编辑模式下直接使用编辑网格；对象模式下使用独立bmesh，无需切换模式
+        if in_edit_mode:
+            bm = bmesh.from_edit_mesh(me)
+        else:
+            bm = bmesh.new()
+            bm.from_mesh(me)
+
+        try:
+            descriptions = []
+            for i, edit in enumerate(edits):
+                try:
+                    descriptions.append(_EDIT_HANDLERS[edit["type"]](bm, edit))
+                except Exception as e:
+                    message = f"第 {i + 1} 个编辑（{edit.get('type')}）出错: {str(e)}"
+                    if in_edit_mode:
+                        # 编辑模式下bmesh即编辑网格本身，之前的编辑已生效，同步后如实报告
+                        bmesh.update_edit_mesh(me)
+                        if i:
+                            message += f"；前 {i} 个编辑已应用"
+                    # 对象模式下尚未写回网格，出错时网格保持不变
+                    return self.create_error_result(message)
+
+            # 所有编辑完成后只同步一次网格
+            if in_edit_mode:
+                bmesh.update_edit_mesh(me)
+            else:
+                bm.to_mesh(me)
+                me.update()
+        finally:
+            if not in_edit_mode:
+                bm.free()
+
+        text_content = self.create_text_content(
+            f"已在对象 '{object_name}' 上执行 {len(edits)} 个编辑: {'; '.join(descriptions)}"
+        )
+
+        # 返回结果
+        return self.create_result([text_content])
+
+
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(MeshBatchHandler)
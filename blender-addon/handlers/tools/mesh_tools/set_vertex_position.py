@@ -4,90 +4,145 @@
 
 import bpy
 from ..registry import register_tool
-import bmesh
+import array
+import base64
+import binascii
 import logging
-from typing import Any, Dict, List, Optional
-import mathutils
+import sys
+from typing import Any, Dict, List, Optional, Sequence
 
-from ..base_tool_handler import BaseToolHandler
+# NumPy随Blender一同发布；缺失时退回逐顶点写入
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
 from ....utils import thread_utils
+from ._shared import move_vertices
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.SetVertexPosition")
 
+def _move_vertices_numpy(mesh, idx, value: Sequence[float], absolute: bool) -> None:
+    """一次性读取全部顶点坐标，在NumPy中批量修改后整体写回"""
+    # Blender 3.5+ 的顶点坐标存放在 "position" 属性中，直接读写可绕过 MeshVertex 包装
+    position = mesh.attributes.get("position")
+    if position is not None:
+        data, prop = position.data, "vector"
+    else:
+        data, prop = mesh.vertices, "co"
+    
+    coords = np.empty(len(data) * 3, dtype=np.float32)
+    data.foreach_get(prop, coords)
+    co = coords.reshape(-1, 3)
+    
+    if absolute:
+        co[idx] = value
+    else:
+        co[idx] += value
+    
+    data.foreach_set(prop, coords)
+
+def _decode_indices(raw: bytes) -> array.array:
+    """无NumPy时将int32小端字节解码为整数数组"""
+    indices = array.array("i", raw)
+    if sys.byteorder != "little":
+        indices.byteswap()
+    return indices
+
 class SetVertexPositionHandler(BaseToolHandler):
     """设置顶点位置工具处理器"""
     
-    @property
-    def name(self) -> str:
-        return "mcp_blender_set_vertex_position"
-        
-    @property
-    def description(self) -> Optional[str]:
-        return "设置网格对象中顶点的位置"
-        
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "object_name": {
-                    "type": "string",
-                    "title": "对象名称",
-                    "description": "要操作的网格对象名称"
-                },
-                "vertex_indices": {
-                    "type": "array",
-                    "title": "顶点索引",
-                    "description": "要移动的顶点索引数组",
-                    "items": {
-                        "type": "integer"
-                    }
+    name = "mcp_blender_set_vertex_position"
+    description = "设置网格对象中顶点的位置"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "object_name": {
+                "type": "string",
+                "title": "对象名称",
+                "description": "要操作的网格对象名称",
+                "minLength": 1
+            },
+            "vertex_indices": {
+                "type": "array",
+                "title": "顶点索引",
+                "description": "要移动的顶点索引数组",
+                "items": {
+                    "type": "integer"
                 },
-                "position": {
-                    "type": "array",
-                    "title": "位置",
-                    "description": "顶点的新位置 [x, y, z]",
-                    "items": {
-                        "type": "number"
-                    }
+                "minItems": 1
+            },
+            "vertex_indices_bytes": {
+                "type": "string",
+                "title": "顶点索引（二进制）",
+                "description": "base64编码的int32小端顶点索引数组，用于传输大量索引；提供时替代vertex_indices",
+                "minLength": 1
+            },
+            "position": {
+                "type": "array",
+                "title": "位置",
+                "description": "顶点的新位置 [x, y, z]",
+                "items": {
+                    "type": "number"
                 },
-                "offset": {
-                    "type": "array",
-                    "title": "偏移量",
-                    "description": "顶点的位置偏移 [dx, dy, dz]",
-                    "items": {
-                        "type": "number"
-                    }
+                "minItems": 3,
+                "maxItems": 3
+            },
+            "offset": {
+                "type": "array",
+                "title": "偏移量",
+                "description": "顶点的位置偏移 [dx, dy, dz]",
+                "items": {
+                    "type": "number"
                 },
-                "relative": {
-                    "type": "boolean",
-                    "title": "相对移动",
-                    "description": "是否为相对于当前位置的移动",
-                    "default": False
-                }
+                "minItems": 3,
+                "maxItems": 3
             },
-            "required": ["object_name"]
-        }
+            "relative": {
+                "type": "boolean",
+                "title": "相对移动",
+                "description": "是否为相对于当前位置的移动",
+                "default": False
+            }
+        },
+        "required": ["object_name"]
+    }
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
-        # 检查对象名称
-        if not arguments.get("object_name"):
-            return "必须提供对象名称"
-            
-        # 检查顶点索引
-        vertex_indices = arguments.get("vertex_indices")
-        if not vertex_indices or not isinstance(vertex_indices, list) or len(vertex_indices) == 0:
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            error = self.validate_schema(arguments)
+            if error:
+                return error
+        else:
+            # 检查对象名称
+            if not arguments.get("object_name"):
+                return "必须提供对象名称"
+                
+            # 检查顶点索引
+            vertex_indices = arguments.get("vertex_indices")
+            if vertex_indices is not None and (not isinstance(vertex_indices, list) or len(vertex_indices) == 0):
+                return "必须提供至少一个顶点索引"
+        
+        # 顶点索引可以是列表或二进制数据（二者至少提供一个）
+        if not arguments.get("vertex_indices") and not arguments.get("vertex_indices_bytes"):
             return "必须提供至少一个顶点索引"
             
-        # 检查位置和偏移参数
+        # 检查位置和偏移参数（二者至少提供一个，模式中不表达此跨字段约束）
         position = arguments.get("position")
         offset = arguments.get("offset")
         
         if not position and not offset:
             return "必须提供位置或偏移参数"
             
+        if HAS_SCHEMA_VALIDATOR:
+            return None
+            
         if position and not (isinstance(position, list) and len(position) == 3 and all(isinstance(v, (int, float)) for v in position)):
             return "位置参数必须是包含3个数字的数组 [x, y, z]"
             
@@ -112,62 +167,71 @@ class SetVertexPositionHandler(BaseToolHandler):
         relative = arguments.get("relative", False)
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 确保对象是网格类型
         if obj.type != 'MESH':
-            text_content = self.create_text_content(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
         
         # 获取网格数据
         mesh = obj.data
+        verts = mesh.vertices
+        total_verts = len(verts)
         
-        # 检查顶点索引是否有效
-        if any(idx < 0 or idx >= len(mesh.vertices) for idx in vertex_indices):
-            text_content = self.create_text_content(f"顶点索引超出范围，对象 '{object_name}' 有 {len(mesh.vertices)} 个顶点")
-            return self.create_result([text_content], is_error=True)
+        # 二进制索引直接解码为数组，不经过Python整数列表
+        indices_bytes = arguments.get("vertex_indices_bytes")
+        if indices_bytes:
+            try:
+                raw = base64.b64decode(indices_bytes, validate=True)
+            except (binascii.Error, ValueError):
+                return self.create_error_result("vertex_indices_bytes 不是有效的base64数据")
+            if len(raw) % 4:
+                return self.create_error_result("vertex_indices_bytes 的长度必须是4字节的整数倍")
+            vertex_indices = np.frombuffer(raw, dtype="<i4") if HAS_NUMPY else _decode_indices(raw)
+        
+        # 去除重复索引（结果已排序），避免相对移动时同一顶点被重复偏移
+        if HAS_NUMPY:
+            idx = np.unique(np.asarray(vertex_indices, dtype=np.intp))
+        else:
+            idx = sorted({int(i) for i in vertex_indices})
+        vertex_count = len(idx)
+        
+        # 检查顶点索引是否有效，排序后只需检查首尾元素
+        if vertex_count == 0 or idx[0] < 0 or idx[-1] >= total_verts:
+            return self.create_error_result(f"顶点索引超出范围，对象 '{object_name}' 有 {total_verts} 个顶点")
         
         # 移动顶点
         try:
-            if position:
-                # 设置绝对位置
-                pos_vector = mathutils.Vector(position)
-                for idx in vertex_indices:
-                    if relative:
-                        mesh.vertices[idx].co += pos_vector
-                    else:
-                        mesh.vertices[idx].co = pos_vector
-            elif offset:
-                # 应用偏移
-                offset_vector = mathutils.Vector(offset)
-                for idx in vertex_indices:
-                    mesh.vertices[idx].co += offset_vector
+            # 未设置relative时position为绝对位置，其余情况为相对偏移
+            value = position if position else offset
+            absolute = bool(position) and not relative
+            
+            if HAS_NUMPY:
+                _move_vertices_numpy(mesh, idx, value, absolute)
+            else:
+                move_vertices(verts, idx, value, absolute)
             
-            # 更新网格
+            # foreach_set 不会触发RNA更新回调，需调用 update() 重新计算法线和包围盒
             mesh.update()
             
             # 描述操作
             if position:
                 if relative:
-                    op_desc = f"相对移动 {len(vertex_indices)} 个顶点，位移: {position}"
+                    op_desc = f"相对移动 {vertex_count} 个顶点，位移: {position}"
                 else:
-                    op_desc = f"设置 {len(vertex_indices)} 个顶点的位置为 {position}"
+                    op_desc = f"设置 {vertex_count} 个顶点的位置为 {position}"
             else:
-                op_desc = f"偏移 {len(vertex_indices)} 个顶点，偏移量: {offset}"
+                op_desc = f"偏移 {vertex_count} 个顶点，偏移量: {offset}"
             
             text_content = self.create_text_content(f"已在对象 '{object_name}' 上{op_desc}")
         except Exception as e:
-            text_content = self.create_text_content(f"设置顶点位置时出错: {str(e)}")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"设置顶点位置时出错: {str(e)}")
         
         # 返回结果
         return self.create_result([text_content])
 
 
-# 在导入时自动注册工具实例
-register_tool(SetVertexPositionHandler())
\ No newline at end of file
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(SetVertexPositionHandler)
\ No newline at end of file
@@ -4,81 +4,136 @@
 
 import bpy
 from ..registry import register_tool
-import bmesh
 import logging
 from typing import Any, Dict, List, Optional
+import numpy as np
 
-from ..base_tool_handler import BaseToolHandler
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
 from ....utils import thread_utils
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.SubdivideMesh")
 
+def _valid_indices(indices: List[int], count: int, kind: str):
+    """过滤超出范围的索引，并记录被丢弃的数量"""
+    idx = np.asarray(indices, dtype=np.intp)
+    valid = idx[(idx >= 0) & (idx < count)]
+    dropped = len(idx) - len(valid)
+    if dropped:
+        logger.warning("忽略 %d 个超出范围的%s索引（共 %d 个%s）", dropped, kind, count, kind)
+    return valid
+
+def _select_elements(mesh, edge_indices: List[int], face_indices: List[int]) -> int:
+    """
+    在对象模式下用 foreach_set 批量写入顶点/边/面的选择状态，返回实际选中的边或面数
+    
+    边和面索引都为空时选中所有面（不包括不属于任何面的游离边）
+    """
+    verts, edges, polys = mesh.vertices, mesh.edges, mesh.polygons
+    vert_sel = np.zeros(len(verts), dtype=bool)
+    edge_sel = np.zeros(len(edges), dtype=bool)
+    poly_sel = np.zeros(len(polys), dtype=bool)
+    
+    if edge_indices:
+        idx = _valid_indices(edge_indices, len(edges), "边")
+        edge_sel[idx] = True
+        
+        # 同时选中这些边的端点，保证进入编辑模式后选择状态一致
+        edge_verts = np.empty(len(edges) * 2, dtype=np.int32)
+        edges.foreach_get("vertices", edge_verts)
+        vert_sel[edge_verts.reshape(-1, 2)[idx].ravel()] = True
+    else:
+        if face_indices:
+            poly_sel[_valid_indices(face_indices, len(polys), "面")] = True
+        else:
+            poly_sel[:] = True
+        
+        # 通过面角（loop）找到这些面的顶点和边
+        loops = mesh.loops
+        loop_totals = np.empty(len(polys), dtype=np.int32)
+        polys.foreach_get("loop_total", loop_totals)
+        loop_sel = np.repeat(poly_sel, loop_totals)
+        loop_verts = np.empty(len(loops), dtype=np.int32)
+        loops.foreach_get("vertex_index", loop_verts)
+        loop_edges = np.empty(len(loops), dtype=np.int32)
+        loops.foreach_get("edge_index", loop_edges)
+        vert_sel[loop_verts[loop_sel]] = True
+        edge_sel[loop_edges[loop_sel]] = True
+    
+    verts.foreach_set("select", vert_sel)
+    edges.foreach_set("select", edge_sel)
+    polys.foreach_set("select", poly_sel)
+    return int(edge_sel.sum() if edge_indices else poly_sel.sum())
+
 class SubdivideMeshHandler(BaseToolHandler):
     """细分网格工具处理器"""
     
-    @property
-    def name(self) -> str:
-        return "mcp_blender_subdivide_mesh"
-        
-    @property
-    def description(self) -> Optional[str]:
-        return "细分网格对象的选定边或面"
-        
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "object_name": {
-                    "type": "string",
-                    "title": "对象名称",
-                    "description": "要操作的网格对象名称"
-                },
-                "cuts": {
-                    "type": "integer",
-                    "title": "切割数量",
-                    "description": "要创建的切割数量",
-                    "default": 1,
-                    "minimum": 1,
-                    "maximum": 10
-                },
-                "smoothness": {
-                    "type": "number",
-                    "title": "平滑度",
-                    "description": "细分的平滑度",
-                    "default": 0.0,
-                    "minimum": 0.0,
-                    "maximum": 1.0
-                },
-                "edge_indices": {
-                    "type": "array",
-                    "title": "边索引",
-                    "description": "要细分的边索引数组",
-                    "items": {
-                        "type": "integer"
-                    }
-                },
-                "face_indices": {
-                    "type": "array",
-                    "title": "面索引",
-                    "description": "要细分的面索引数组",
-                    "items": {
-                        "type": "integer"
-                    }
-                },
-                "all": {
-                    "type": "boolean",
-                    "title": "细分全部",
-                    "description": "是否细分所有边或面",
-                    "default": False
+    name = "mcp_blender_subdivide_mesh"
+    description = "细分网格对象的选定边或面"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "object_name": {
+                "type": "string",
+                "title": "对象名称",
+                "description": "要操作的网格对象名称",
+                "minLength": 1
+            },
+            "cuts": {
+                "type": "integer",
+                "title": "切割数量",
+                "description": "要创建的切割数量",
+                "default": 1,
+                "minimum": 1,
+                "maximum": 10
+            },
+            "smoothness": {
+                "type": "number",
+                "title": "平滑度",
+                "description": "细分的平滑度",
+                "default": 0.0,
+                "minimum": 0.0,
+                "maximum": 1.0
+            },
+            "edge_indices": {
+                "type": "array",
+                "title": "边索引",
+                "description": "要细分的边索引数组",
+                "items": {
+                    "type": "integer"
+                }
+            },
+            "face_indices": {
+                "type": "array",
+                "title": "面索引",
+                "description": "要细分的面索引数组",
+                "items": {
+                    "type": "integer"
                 }
             },
-            "required": ["object_name"]
-        }
+            "all": {
+                "type": "boolean",
+                "title": "细分全部",
+                "description": "是否细分所有边或面",
+                "default": False
+            },
+            "keep_mode": {
+                "type": "boolean",
+                "title": "保持编辑模式",
+                "description": "操作完成后保持编辑模式，便于连续调用多个网格工具时省去模式切换",
+                "default": False
+            }
+        },
+        "required": ["object_name"]
+    }
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
         # 检查对象名称
         if not arguments.get("object_name"):
             return "必须提供对象名称"
@@ -110,57 +165,37 @@ class SubdivideMeshHandler(BaseToolHandler):
         edge_indices = arguments.get("edge_indices", [])
         face_indices = arguments.get("face_indices", [])
         use_all = arguments.get("all", False)
+        keep_mode = arguments.get("keep_mode", False)
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 确保对象是网格类型
         if obj.type != 'MESH':
-            text_content = self.create_text_content(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"只能对网格对象操作，而 '{object_name}' 是 '{obj.type}' 类型")
+        
+        # 缓存操作符引用，避免每次调用都重新遍历 bpy.ops 属性链
+        mode_set = bpy.ops.object.mode_set
         
         # 确保对象是活动对象
         bpy.context.view_layer.objects.active = obj
         
-        # 进入编辑模式
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # 创建bmesh实例
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
+        # 除"细分全部"外，在对象模式下批量写入选择状态（未指定索引时为所有面），进入编辑模式后自动同步
+        select_everything = use_all and not (edge_indices or face_indices)
+        if not select_everything:
+            if obj.mode != 'OBJECT':
+                mode_set(mode='OBJECT')
+            selected_count = _select_elements(obj.data, edge_indices, face_indices)
         
-        # 取消所有选择
-        for edge in bm.edges:
-            edge.select = False
-        for face in bm.faces:
-            face.select = False
+        # 进入编辑模式（对象已处于编辑模式时跳过切换）
+        if obj.mode != 'EDIT':
+            mode_set(mode='EDIT')
         
-        # 选择要细分的几何体
-        if edge_indices:
-            # 选择指定的边
-            for idx in edge_indices:
-                if idx < len(bm.edges):
-                    bm.edges[idx].select = True
-        elif face_indices:
-            # 选择指定的面
-            for idx in face_indices:
-                if idx < len(bm.faces):
-                    bm.faces[idx].select = True
-        elif use_all:
-            # 选择所有几何体
+        if select_everything:
+            # 选择所有几何体，包括游离边
             bpy.ops.mesh.select_all(action='SELECT')
-        else:
-            # 默认选择所有面
-            for face in bm.faces:
-                face.select = True
-        
-        # 更新bmesh到网格
-        bmesh.update_edit_mesh(me)
         
         # 执行细分操作
         try:
@@ -168,9 +203,9 @@ class SubdivideMeshHandler(BaseToolHandler):
             
             # 计算结果信息
             if edge_indices:
-                desc = f"{len(edge_indices)} 条边"
+                desc = f"{selected_count} 条边"
             elif face_indices:
-                desc = f"{len(face_indices)} 个面"
+                desc = f"{selected_count} 个面"
             elif use_all:
                 desc = "所有几何体"
             else:
@@ -178,15 +213,15 @@ class SubdivideMeshHandler(BaseToolHandler):
             
             text_content = self.create_text_content(f"已细分对象 '{object_name}' 上的 {desc}，切割数: {cuts}，平滑度: {smoothness}")
         except Exception as e:
-            text_content = self.create_text_content(f"细分网格时出错: {str(e)}")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"细分网格时出错: {str(e)}")
         finally:
-            # 返回对象模式
-            bpy.ops.object.mode_set(mode='OBJECT')
+            # 返回对象模式（keep_mode 时保持编辑模式）
+            if not keep_mode:
+                mode_set(mode='OBJECT')
         
         # 返回结果
         return self.create_result([text_content])
 
 
-# 在导入时自动注册工具实例
-register_tool(SubdivideMeshHandler())
\ No newline at end of file
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(SubdivideMeshHandler)
\ No newline at end of file
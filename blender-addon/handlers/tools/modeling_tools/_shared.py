@@ -0,0 +1,71 @@
+"""
+modeling工具模块共用的辅助函数
+"""
+
+import bpy
+import functools
+import logging
+from typing import Any, Callable, Dict, List
+
+from ....utils import thread_utils
+
+# 获取日志器
+logger = logging.getLogger("BlenderMCP.ModelingTools")
+
+def main_thread(action: str) -> Callable:
+    """
+    装饰器：把工具的实现方法放到Blender主线程中执行
+    
+    Args:
+        action: 操作描述，用于日志
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, arguments: Dict[str, Any]) -> Any:
+            logger.info("%s，参数: %s", action, arguments)
+            return thread_utils.run_in_main_thread(func, self, arguments)
+        return wrapper
+    return decorator
+
+def apply_object_modifier(obj, modifier_name: str) -> None:
+    """
+    应用对象上的修改器
+    
+    通过上下文覆盖指定目标对象，调用方无需先把 obj 设为活动对象；
+    report=False 跳过操作符的报告生成。
+    """
+    with bpy.context.temp_override(object=obj, active_object=obj):
+        bpy.ops.object.modifier_apply(modifier=modifier_name, report=False)
+
+def can_bake_modifiers(obj) -> bool:
+    """对象是否可以通过依赖图一次性烘焙全部修改器（需处于对象模式且没有形态键）"""
+    return obj.type == 'MESH' and obj.mode == 'OBJECT' and obj.data.shape_keys is None
+
+def bake_modifiers(obj) -> List[str]:
+    """
+    通过一次依赖图求值把对象上所有启用的修改器烘焙到新网格，返回已应用的修改器名称
+    
+    与逐个调用 modifier_apply 相比，无论有多少个修改器都只求值一次，也不会产生撤销步骤。
+    未在视图中启用的修改器不参与求值，保留在修改器栈中。
+    """
+    applied = [mod for mod in obj.modifiers if mod.show_viewport]
+    if not applied:
+        return []
+    
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    new_mesh = bpy.data.meshes.new_from_object(
+        obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+    )
+    
+    # 替换网格数据，旧网格没有其他用户时删除并沿用其名称
+    old_mesh = obj.data
+    mesh_name = old_mesh.name
+    obj.data = new_mesh
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+        new_mesh.name = mesh_name
+    
+    names = [mod.name for mod in applied]
+    for mod in applied:
+        obj.modifiers.remove(mod)
+    return names
@@ -7,58 +7,70 @@ from ..registry import register_tool
 import logging
 from typing import Any, Dict, List, Optional
 
-from ..base_tool_handler import BaseToolHandler
-from ....utils import thread_utils
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
+from ._shared import main_thread
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.AddModifier")
 
+# 支持的修改器类型（模式枚举与参数检查共用）
+_MODIFIER_TYPE_ENUM = [
+    "SUBSURF", "BEVEL", "ARRAY", "MIRROR", "SOLIDIFY",
+    "BOOLEAN", "SHRINKWRAP", "DISPLACE", "ARMATURE", "CURVE"
+]
+_VALID_MODIFIER_TYPES = frozenset(_MODIFIER_TYPE_ENUM)
+_VALID_MODIFIER_TYPES_STR = ", ".join(_MODIFIER_TYPE_ENUM)
+
+# 各修改器类型的默认参数，用户提供的参数优先
+_MODIFIER_DEFAULTS = {
+    "SUBSURF": {"levels": 2, "render_levels": 2},
+    "BEVEL": {"width": 0.1},
+    "ARRAY": {"count": 2},
+}
+
+# 工具输入模式
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "object_name": {
+            "type": "string",
+            "title": "对象名称",
+            "description": "要添加修改器的对象名称",
+            "minLength": 1
+        },
+        "modifier_type": {
+            "type": "string",
+            "title": "修改器类型",
+            "description": "要添加的修改器类型",
+            "enum": _MODIFIER_TYPE_ENUM
+        },
+        "modifier_name": {
+            "type": "string",
+            "title": "修改器名称",
+            "description": "修改器的自定义名称(可选)"
+        },
+        "parameters": {
+            "type": "object",
+            "title": "参数",
+            "description": "修改器的特定参数"
+        }
+    },
+    "required": ["object_name", "modifier_type"]
+}
+
 class AddModifierHandler(BaseToolHandler):
     """添加修改器工具处理器"""
     
-    @property
-    def name(self) -> str:
-        return "mcp_blender_add_modifier"
-        
-    @property
-    def description(self) -> Optional[str]:
-        return "为3D对象添加修改器"
-        
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "object_name": {
-                    "type": "string",
-                    "title": "对象名称",
-                    "description": "要添加修改器的对象名称"
-                },
-                "modifier_type": {
-                    "type": "string",
-                    "title": "修改器类型",
-                    "description": "要添加的修改器类型",
-                    "enum": [
-                        "SUBSURF", "BEVEL", "ARRAY", "MIRROR", "SOLIDIFY", 
-                        "BOOLEAN", "SHRINKWRAP", "DISPLACE", "ARMATURE", "CURVE"
-                    ]
-                },
-                "modifier_name": {
-                    "type": "string",
-                    "title": "修改器名称",
-                    "description": "修改器的自定义名称(可选)"
-                },
-                "parameters": {
-                    "type": "object",
-                    "title": "参数",
-                    "description": "修改器的特定参数"
-                }
-            },
-            "required": ["object_name", "modifier_type"]
-        }
+    name = "mcp_blender_add_modifier"
+    description = "为3D对象添加修改器"
+    input_schema = _INPUT_SCHEMA
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
         # 检查对象名称
         if not arguments.get("object_name"):
             return "必须提供对象名称"
@@ -69,22 +81,12 @@ class AddModifierHandler(BaseToolHandler):
             return "必须提供修改器类型"
             
         # 验证修改器类型是否支持
-        valid_types = [
-            "SUBSURF", "BEVEL", "ARRAY", "MIRROR", "SOLIDIFY", 
-            "BOOLEAN", "SHRINKWRAP", "DISPLACE", "ARMATURE", "CURVE"
-        ]
-        if modifier_type not in valid_types:
-            return f"不支持的修改器类型: {modifier_type}，有效类型: {', '.join(valid_types)}"
+        if modifier_type not in _VALID_MODIFIER_TYPES:
+            return f"不支持的修改器类型: {modifier_type}，有效类型: {_VALID_MODIFIER_TYPES_STR}"
             
         return None
         
-    def execute(self, arguments: Dict[str, Any]) -> Any:
-        """执行添加修改器操作"""
-        logger.info(f"添加修改器，参数: {arguments}")
-        
-        # 在主线程中执行Blender操作
-        return thread_utils.run_in_main_thread(self._add_modifier, arguments)
-        
+    @main_thread("添加修改器")
     def _add_modifier(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """在主线程中添加修改器"""
         object_name = arguments.get("object_name")
@@ -93,57 +95,48 @@ class AddModifierHandler(BaseToolHandler):
         parameters = arguments.get("parameters", {})
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 检查对象类型是否适合添加修改器
         if obj.type not in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'LATTICE'}:
-            text_content = self.create_text_content(f"对象类型 '{obj.type}' 不支持添加修改器")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result(f"对象类型 '{obj.type}' 不支持添加修改器")
         
         # 添加修改器
         mod = obj.modifiers.new(name=modifier_name or modifier_type, type=modifier_type)
         
-        # 设置特定参数
-        for param_name, param_value in parameters.items():
+        # 合并默认参数与用户参数后统一设置
+        merged = {**_MODIFIER_DEFAULTS.get(modifier_type, {}), **parameters}
+        skipped = []
+        for param_name, param_value in merged.items():
+            # 修改器没有的参数直接跳过，不进入异常处理
+            if not hasattr(mod, param_name):
+                logger.warning("跳过未知参数 %s=%r", param_name, param_value)
+                skipped.append(param_name)
+                continue
             try:
-                # 尝试设置参数
                 setattr(mod, param_name, param_value)
-            except:
-                logger.warning(f"无法设置参数 '{param_name}' 为 '{param_value}'")
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.warning("跳过参数 %s=%r: %s", param_name, param_value, e)
+                skipped.append(param_name)
         
-        # 特定修改器类型处理
-        if modifier_type == "SUBSURF":
-            # 设置细分曲面默认值
-            if "levels" not in parameters:
-                mod.levels = 2
-                mod.render_levels = 2
-                
-        elif modifier_type == "BEVEL":
-            # 设置倒角默认值
-            if "width" not in parameters:
-                mod.width = 0.1
-                
-        elif modifier_type == "ARRAY":
-            # 设置阵列默认值
-            if "count" not in parameters:
-                mod.count = 2
-                
-        elif modifier_type == "MIRROR":
-            # 设置镜像默认值
-            if "use_axis" not in parameters:
-                mod.use_axis[0] = True  # 沿X轴镜像
+        # 镜像轴是数组元素赋值，单独处理
+        if modifier_type == "MIRROR" and "use_axis" not in parameters:
+            mod.use_axis[0] = True  # 沿X轴镜像
         
         # 创建结果信息
-        text_content = self.create_text_content(f"已为对象 '{object_name}' 添加 {modifier_type} 修改器")
+        message = f"已为对象 '{object_name}' 添加 {modifier_type} 修改器"
+        if skipped:
+            message += f"，已忽略无法设置的参数: {', '.join(skipped)}"
+        text_content = self.create_text_content(message)
         
         # 返回结果
         return self.create_result([text_content])
+        
+    # 工具入口：参数验证通过后在主线程中执行
+    execute = _add_modifier
 
 
-# 在导入时自动注册工具实例
-register_tool(AddModifierHandler())
\ No newline at end of file
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(AddModifierHandler)
\ No newline at end of file
@@ -7,63 +7,89 @@ from ..registry import register_tool
 import logging
 from typing import Any, Dict, List, Optional
 
-from ..base_tool_handler import BaseToolHandler
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
+from ._shared import apply_object_modifier, bake_modifiers, can_bake_modifiers, main_thread
 from ....utils import thread_utils
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.BooleanOperation")
 
+# 支持的布尔运算类型（模式枚举与参数检查共用）
+_OPERATION_ENUM = ["UNION", "INTERSECT", "DIFFERENCE"]
+_VALID_OPERATIONS = frozenset(_OPERATION_ENUM)
+_VALID_OPERATIONS_STR = ", ".join(_OPERATION_ENUM)
+
+# 延迟删除的工具对象名称，在批量调用结束时通过 bpy.data.batch_remove 一次性删除
+_pending_removals: List[str] = []
+
+def flush_pending_removals() -> int:
+    """一次性删除所有延迟删除的工具对象，返回实际删除的数量"""
+    objects = bpy.data.objects
+    # 按名称重新查找，跳过期间已被删除的对象
+    ids = [obj for obj in (objects.get(name) for name in _pending_removals) if obj is not None]
+    _pending_removals.clear()
+    if ids:
+        bpy.data.batch_remove(ids=ids)
+    return len(ids)
+
+# 工具输入模式
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "target_object": {
+            "type": "string",
+            "title": "目标对象",
+            "description": "执行布尔运算的目标对象名称",
+            "minLength": 1
+        },
+        "tool_object": {
+            "type": "string",
+            "title": "工具对象",
+            "description": "用作布尔运算工具的对象名称",
+            "minLength": 1
+        },
+        "operation": {
+            "type": "string",
+            "title": "运算类型",
+            "description": "要执行的布尔运算类型",
+            "enum": _OPERATION_ENUM,
+            "default": "DIFFERENCE"
+        },
+        "apply_modifier": {
+            "type": "boolean",
+            "title": "应用修改器",
+            "description": "是否立即应用布尔修改器",
+            "default": True
+        },
+        "delete_tool": {
+            "type": "boolean",
+            "title": "删除工具对象",
+            "description": "操作后是否删除工具对象",
+            "default": True
+        },
+        "immediate": {
+            "type": "boolean",
+            "title": "立即删除",
+            "description": "是否立即删除工具对象；为false时延迟到所在的批量调用（mcp_blender_run_tools）结束时与其他工具对象一起批量删除，单独调用时仍立即删除",
+            "default": True
+        }
+    },
+    "required": ["target_object", "tool_object", "operation"]
+}
+
 class BooleanOperationHandler(BaseToolHandler):
     """布尔运算工具处理器"""
     
-    @property
-    def name(self) -> str:
-        return "mcp_blender_boolean_operation"
-        
-    @property
-    def description(self) -> Optional[str]:
-        return "在两个3D对象之间执行布尔运算"
-        
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "target_object": {
-                    "type": "string",
-                    "title": "目标对象",
-                    "description": "执行布尔运算的目标对象名称"
-                },
-                "tool_object": {
-                    "type": "string",
-                    "title": "工具对象",
-                    "description": "用作布尔运算工具的对象名称"
-                },
-                "operation": {
-                    "type": "string",
-                    "title": "运算类型",
-                    "description": "要执行的布尔运算类型",
-                    "enum": ["UNION", "INTERSECT", "DIFFERENCE"],
-                    "default": "DIFFERENCE"
-                },
-                "apply_modifier": {
-                    "type": "boolean",
-                    "title": "应用修改器",
-                    "description": "是否立即应用布尔修改器",
-                    "default": True
-                },
-                "delete_tool": {
-                    "type": "boolean",
-                    "title": "删除工具对象",
-                    "description": "操作后是否删除工具对象",
-                    "default": True
-                }
-            },
-            "required": ["target_object", "tool_object", "operation"]
-        }
+    name = "mcp_blender_boolean_operation"
+    description = "在两个3D对象之间执行布尔运算"
+    input_schema = _INPUT_SCHEMA
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
         # 检查目标对象名称
         if not arguments.get("target_object"):
             return "必须提供目标对象名称"
@@ -78,19 +104,12 @@ class BooleanOperationHandler(BaseToolHandler):
             return "必须提供运算类型"
             
         # 验证运算类型是否支持
-        valid_operations = ["UNION", "INTERSECT", "DIFFERENCE"]
-        if operation not in valid_operations:
-            return f"不支持的运算类型: {operation}，有效类型: {', '.join(valid_operations)}"
+        if operation not in _VALID_OPERATIONS:
+            return f"不支持的运算类型: {operation}，有效类型: {_VALID_OPERATIONS_STR}"
             
         return None
         
-    def execute(self, arguments: Dict[str, Any]) -> Any:
-        """执行布尔运算操作"""
-        logger.info(f"布尔运算，参数: {arguments}")
-        
-        # 在主线程中执行Blender操作
-        return thread_utils.run_in_main_thread(self._boolean_operation, arguments)
-        
+    @main_thread("布尔运算")
     def _boolean_operation(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """在主线程中执行布尔运算"""
         target_object = arguments.get("target_object")
@@ -98,45 +117,52 @@ class BooleanOperationHandler(BaseToolHandler):
         operation = arguments.get("operation")
         apply_modifier = arguments.get("apply_modifier", True)
         delete_tool = arguments.get("delete_tool", True)
+        immediate = arguments.get("immediate", True)
+        
+        objects = bpy.data.objects
         
         # 检查目标对象是否存在
-        if target_object not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到目标对象: {target_object}")
-            return self.create_result([text_content], is_error=True)
+        target = objects.get(target_object)
+        if target is None:
+            return self.create_error_result("找不到目标对象: {target_object}", target_object=target_object)
         
         # 检查工具对象是否存在
-        if tool_object not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到工具对象: {tool_object}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        target = bpy.data.objects[target_object]
-        tool = bpy.data.objects[tool_object]
+        tool = objects.get(tool_object)
+        if tool is None:
+            return self.create_error_result("找不到工具对象: {tool_object}", tool_object=tool_object)
         
         # 检查对象类型
         if target.type != 'MESH' or tool.type != 'MESH':
-            text_content = self.create_text_content("布尔运算只能在网格对象之间进行")
-            return self.create_result([text_content], is_error=True)
+            return self.create_error_result("布尔运算只能在网格对象之间进行")
         
         # 添加布尔修改器
         bool_mod = target.modifiers.new(name="Boolean", type='BOOLEAN')
         bool_mod.object = tool
         bool_mod.operation = operation
         
-        # 确保目标对象是活动对象
-        bpy.context.view_layer.objects.active = target
-        
         # 应用修改器（如果需要）
         if apply_modifier:
             try:
-                bpy.ops.object.modifier_apply(modifier=bool_mod.name)
+                # 布尔修改器是唯一的修改器时，直接通过依赖图烘焙，其余情况逐个应用
+                if len(target.modifiers) == 1 and can_bake_modifiers(target):
+                    bake_modifiers(target)
+                else:
+                    apply_object_modifier(target, bool_mod.name)
             except Exception as e:
-                text_content = self.create_text_content(f"应用布尔修改器时出错: {str(e)}")
-                return self.create_result([text_content], is_error=True)
+                return self.create_error_result(f"应用布尔修改器时出错: {str(e)}")
         
         # 删除工具对象（如果需要）
         if delete_tool:
-            bpy.data.objects.remove(tool)
+            if not immediate:
+                # 延迟到批量调用结束时统一删除，合并依赖图更新
+                _pending_removals.append(tool.name)
+                thread_utils.call_at_batch_end(flush_pending_removals)
+            elif _pending_removals:
+                # 批次结束，连同之前延迟的工具对象一起删除
+                _pending_removals.append(tool.name)
+                flush_pending_removals()
+            else:
+                objects.remove(tool)
         
         # 创建结果信息
         text_content = self.create_text_content(
@@ -146,7 +172,10 @@ class BooleanOperationHandler(BaseToolHandler):
         
         # 返回结果
         return self.create_result([text_content])
+        
+    # 工具入口：参数验证通过后在主线程中执行
+    execute = _boolean_operation
 
 
-# 在导入时自动注册工具实例
-register_tool(BooleanOperationHandler())
\ No newline at end of file
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(BooleanOperationHandler)
\ No newline at end of file
@@ -7,52 +7,53 @@ from ..registry import register_tool
 import logging
 from typing import Any, Dict, List, Optional
 
-from ..base_tool_handler import BaseToolHandler
-from ....utils import thread_utils
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
+from ._shared import main_thread
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.RemoveModifier")
 
+# 工具输入模式
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "object_name": {
+            "type": "string",
+            "title": "对象名称",
+            "description": "要删除修改器的对象名称",
+            "minLength": 1
+        },
+        "modifier_name": {
+            "type": "string",
+            "title": "修改器名称",
+            "description": "要删除的修改器名称"
+        },
+        "remove_all": {
+            "type": "boolean",
+            "title": "删除所有",
+            "description": "是否删除对象上的所有修改器",
+            "default": False
+        }
+    },
+    "required": ["object_name"]
+}
+
 class RemoveModifierHandler(BaseToolHandler):
     """删除修改器工具处理器"""
     
-    @property
-    def name(self) -> str:
-        return "mcp_blender_remove_modifier"
-        
-    @property
-    def description(self) -> Optional[str]:
-        return "删除3D对象上的修改器"
-        
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "object_name": {
-                    "type": "string",
-                    "title": "对象名称",
-                    "description": "要删除修改器的对象名称"
-                },
-                "modifier_name": {
-                    "type": "string",
-                    "title": "修改器名称",
-                    "description": "要删除的修改器名称"
-                },
-                "remove_all": {
-                    "type": "boolean",
-                    "title": "删除所有",
-                    "description": "是否删除对象上的所有修改器",
-                    "default": False
-                }
-            },
-            "required": ["object_name"]
-        }
+    name = "mcp_blender_remove_modifier"
+    description = "删除3D对象上的修改器"
+    input_schema = _INPUT_SCHEMA
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
-        # 检查对象名称
-        if not arguments.get("object_name"):
+        # 优先使用预编译的模式验证器，跨字段的约束仍在下面检查
+        if HAS_SCHEMA_VALIDATOR:
+            error = self.validate_schema(arguments)
+            if error:
+                return error
+        elif not arguments.get("object_name"):
+            # 检查对象名称
             return "必须提供对象名称"
             
         # 如果不是删除所有，则必须提供修改器名称
@@ -61,13 +62,7 @@ class RemoveModifierHandler(BaseToolHandler):
             
         return None
         
-    def execute(self, arguments: Dict[str, Any]) -> Any:
-        """执行删除修改器操作"""
-        logger.info(f"删除修改器，参数: {arguments}")
-        
-        # 在主线程中执行Blender操作
-        return thread_utils.run_in_main_thread(self._remove_modifier, arguments)
-        
+    @main_thread("删除修改器")
     def _remove_modifier(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """在主线程中删除修改器"""
         object_name = arguments.get("object_name")
@@ -75,21 +70,23 @@ class RemoveModifierHandler(BaseToolHandler):
         remove_all = arguments.get("remove_all", False)
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         removed_modifiers = []
         
         if remove_all:
             # 删除所有修改器
-            for mod in list(obj.modifiers):  # 创建列表副本，因为删除过程中会修改原列表
-                mod_name = mod.name
-                obj.modifiers.remove(mod)
-                removed_modifiers.append(mod_name)
+            modifiers = obj.modifiers
+            removed_modifiers = [mod.name for mod in modifiers]
+            clear = getattr(modifiers, "clear", None)
+            if clear is not None:
+                # 一次调用清空整个修改器栈
+                clear()
+            else:
+                for mod in list(modifiers):  # 创建列表副本，因为删除过程中会修改原列表
+                    modifiers.remove(mod)
             
             if removed_modifiers:
                 text_content = self.create_text_content(f"已删除对象 '{object_name}' 上的所有修改器: {', '.join(removed_modifiers)}")
@@ -104,12 +101,14 @@ class RemoveModifierHandler(BaseToolHandler):
                 removed_modifiers.append(modifier_name)
                 text_content = self.create_text_content(f"已删除对象 '{object_name}' 上的修改器: {modifier_name}")
             else:
-                text_content = self.create_text_content(f"对象 '{object_name}' 上找不到修改器: {modifier_name}")
-                return self.create_result([text_content], is_error=True)
+                return self.create_error_result(f"对象 '{object_name}' 上找不到修改器: {modifier_name}")
         
         # 返回结果
         return self.create_result([text_content])
+        
+    # 工具入口：参数验证通过后在主线程中执行
+    execute = _remove_modifier
 
 
-# 在导入时自动注册工具实例
-register_tool(RemoveModifierHandler())
\ No newline at end of file
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(RemoveModifierHandler)
\ No newline at end of file
@@ -7,126 +7,135 @@ from ..registry import register_tool
 import logging
 from typing import Any, Dict, List, Optional
 
-from ..base_tool_handler import BaseToolHandler
-from ....utils import thread_utils
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
+from ._shared import main_thread
 
 # 获取日志器
 logger = logging.getLogger("BlenderMCP.SeparateParts")
 
+# 支持的分离方法（模式枚举与参数检查共用）
+_METHOD_ENUM = ["LOOSE", "MATERIAL", "SELECTED"]
+_VALID_METHODS = frozenset(_METHOD_ENUM)
+_VALID_METHODS_STR = ", ".join(_METHOD_ENUM)
+
+# 工具输入模式
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "object_name": {
+            "type": "string",
+            "title": "对象名称",
+            "description": "要分离的对象名称",
+            "minLength": 1
+        },
+        "method": {
+            "type": "string",
+            "title": "分离方法",
+            "description": "分离对象的方法",
+            "enum": _METHOD_ENUM,
+            "default": "LOOSE"
+        },
+        "prefix": {
+            "type": "string",
+            "title": "名称前缀",
+            "description": "分离后的对象名称前缀（可选）"
+        }
+    },
+    "required": ["object_name"]
+}
+
 class SeparatePartsHandler(BaseToolHandler):
     """分离对象工具处理器"""
     
-    @property
-    def name(self) -> str:
-        return "mcp_blender_separate_parts"
-        
-    @property
-    def description(self) -> Optional[str]:
-        return "将3D对象分离为多个部分"
-        
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "object_name": {
-                    "type": "string",
-                    "title": "对象名称",
-                    "description": "要分离的对象名称"
-                },
-                "method": {
-                    "type": "string",
-                    "title": "分离方法",
-                    "description": "分离对象的方法",
-                    "enum": ["LOOSE", "MATERIAL", "SELECTED"],
-                    "default": "LOOSE"
-                },
-                "prefix": {
-                    "type": "string",
-                    "title": "名称前缀",
-                    "description": "分离后的对象名称前缀（可选）"
-                }
-            },
-            "required": ["object_name"]
-        }
+    name = "mcp_blender_separate_parts"
+    description = "将3D对象分离为多个部分"
+    input_schema = _INPUT_SCHEMA
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
         # 检查对象名称
         if not arguments.get("object_name"):
             return "必须提供对象名称"
             
         # 检查分离方法
         method = arguments.get("method", "LOOSE")
-        valid_methods = ["LOOSE", "MATERIAL", "SELECTED"]
-        if method not in valid_methods:
-            return f"不支持的分离方法: {method}，有效方法: {', '.join(valid_methods)}"
+        if method not in _VALID_METHODS:
+            return f"不支持的分离方法: {method}，有效方法: {_VALID_METHODS_STR}"
             
         return None
         
-    def execute(self, arguments: Dict[str, Any]) -> Any:
-        """执行分离对象操作"""
-        logger.info(f"分离对象，参数: {arguments}")
-        
-        # 在主线程中执行Blender操作
-        return thread_utils.run_in_main_thread(self._separate_parts, arguments)
-        
+    @main_thread("分离对象")
     def _separate_parts(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """在主线程中分离对象"""
+        # NumPy只在分离时用到，延迟导入以加快插件加载
+        import numpy as np
+        
         object_name = arguments.get("object_name")
         method = arguments.get("method", "LOOSE")
         prefix = arguments.get("prefix", "")
+        objects = bpy.data.objects
         
         # 检查对象是否存在
-        if object_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {object_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[object_name]
+        obj = objects.get(object_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {object_name}", object_name=object_name)
         
         # 确保对象是网格类型
         if obj.type != 'MESH':
-            text_content = self.create_text_content(f"只能分离网格对象，而 '{object_name}' 是 '{obj.type}' 类型")
-            return self.create_result([text_content], is_error=True)
-        
-        # 记录原始对象计数
-        original_object_count = len(bpy.data.objects)
+            return self.create_error_result(f"只能分离网格对象，而 '{object_name}' 是 '{obj.type}' 类型")
+        
+        # 按材质分离时先批量读取面的材质索引，只用到一种材质时无需进入编辑模式
+        if method == "MATERIAL" and obj.mode != 'EDIT':
+            polys = obj.data.polygons
+            material_indices = np.empty(len(polys), dtype=np.int32)
+            polys.foreach_get("material_index", material_indices)
+            if len(np.unique(material_indices)) < 2:
+                text_content = self.create_text_content(f"对象 '{object_name}' 没有可分离的部分")
+                return self.create_result([text_content])
+        
+        # 记录分离前的对象名称，分离后通过集合差得到新对象
+        names_before = set(objects.keys())
+        
+        # 缓存操作符引用，避免每次调用都重新遍历 bpy.ops 属性链
+        mode_set = bpy.ops.object.mode_set
+        ops_mesh = bpy.ops.mesh
+        
+        # 松散部分和按选择分离需要全选几何体
+        select_all = method in ("LOOSE", "SELECTED")
+        
+        # 对象模式下直接批量写入选择状态，进入编辑模式后自动同步，省去选择操作符
+        if select_all and obj.mode != 'EDIT':
+            mesh = obj.data
+            for elements in (mesh.vertices, mesh.edges, mesh.polygons):
+                elements.foreach_set("select", np.ones(len(elements), dtype=bool))
+            select_all = False
         
         # 确保目标对象是活动对象且处于编辑模式
         bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # 根据方法执行不同的选择
-        if method == "LOOSE":
-            # 选择所有顶点
-            bpy.ops.mesh.select_all(action='SELECT')
-            # 分离松散部分
-            bpy.ops.mesh.separate(type='LOOSE')
-            
-        elif method == "MATERIAL":
-            # 选择所有顶点
-            bpy.ops.mesh.select_all(action='SELECT')
-            # 按材质分离
-            bpy.ops.mesh.separate(type='MATERIAL')
-            
-        elif method == "SELECTED":
-            # 如果是按选择分离，确保有选中的顶点
-            bpy.ops.mesh.select_all(action='SELECT')
-            # 按选择分离
-            bpy.ops.mesh.separate(type='SELECTED')
+        if obj.mode != 'EDIT':
+            mode_set(mode='EDIT')
+        
+        # 对象原本就处于编辑模式时仍使用操作符全选
+        if select_all:
+            ops_mesh.select_all(action='SELECT')
+        
+        # 根据方法执行分离（按材质分离作用于整个网格，不依赖选择状态）
+        ops_mesh.separate(type=method)
         
         # 返回对象模式
-        bpy.ops.object.mode_set(mode='OBJECT')
+        mode_set(mode='OBJECT')
         
-        # 计算新创建的对象数量
-        new_objects = []
-        for new_obj in bpy.data.objects:
-            if new_obj.name.startswith(object_name + "."):
-                new_objects.append(new_obj)
-                # 如果提供了前缀，重命名对象
-                if prefix:
-                    new_obj.name = prefix + new_obj.name.split(".", 1)[1]
+        # 计算新创建的对象
+        new_objects = [objects[name] for name in sorted(set(objects.keys()) - names_before)]
+        
+        # 如果提供了前缀，重命名对象（保留Blender生成的编号后缀）
+        if prefix:
+            for new_obj in new_objects:
+                new_obj.name = prefix + new_obj.name.rsplit(".", 1)[-1]
         
         # 创建结果信息
         if len(new_objects) > 0:
@@ -137,7 +146,10 @@ class SeparatePartsHandler(BaseToolHandler):
         
         # 返回结果
         return self.create_result([text_content])
+        
+    # 工具入口：参数验证通过后在主线程中执行
+    execute = _separate_parts
 
 
-# 在导入时自动注册工具实例
-register_tool(SeparatePartsHandler())
\ No newline at end of file
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(SeparatePartsHandler)
\ No newline at end of file
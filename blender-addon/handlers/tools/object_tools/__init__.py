@@ -4,7 +4,6 @@ object工具模块
 
 import os
 import importlib
-import inspect
 from pathlib import Path
 
 from ....logger import get_logger
@@ -1,7 +1,7 @@
 import bpy
+import bmesh
 import logging
 from typing import Any, Dict, List, Optional
-from mathutils import Vector
 
 from ..base_tool_handler import BaseToolHandler
 from ....utils import thread_utils
@@ -13,6 +13,52 @@ logger = logging.getLogger("BlenderMCP.CreateObject")
 # 在导入时输出日志，用于调试
 logger.info("正在加载创建对象工具模块")
 
+# 网格图元的bmesh构建函数，按对象类型查表分派
+_MESH_BUILDERS = {
+    "cube": lambda bm, size: bmesh.ops.create_cube(bm, size=size, calc_uvs=True),
+    "sphere": lambda bm, size: bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=size/2, calc_uvs=True),
+    "plane": lambda bm, size: bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=size/2, calc_uvs=True),
+    "cylinder": lambda bm, size: bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=size/2, radius2=size/2, depth=size, calc_uvs=True),
+    "cone": lambda bm, size: bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=size/2, radius2=0, depth=size, calc_uvs=True),
+}
+
+# 支持的全部对象类型
+VALID_OBJECT_TYPES = ("cube", "sphere", "plane", "cylinder", "cone", "torus", "empty")
+
+def build_object(object_type: str, name: str, location, size: float):
+    """创建指定类型的对象并添加到当前集合，返回新对象（需在主线程中调用）"""
+    builder = _MESH_BUILDERS.get(object_type)
+    if builder is not None:
+        # 直接用bmesh构建网格数据块，跳过操作符的上下文准备和撤销记录
+        mesh = bpy.data.meshes.new(name)
+        bm = bmesh.new()
+        try:
+            # calc_uvs只填充已有的UV层，新建的bmesh需先创建与操作符一致的UV贴图
+            bm.loops.layers.uv.new("UVMap")
+            builder(bm, size)
+            bm.to_mesh(mesh)
+        finally:
+            bm.free()
+        created_object = bpy.data.objects.new(name, mesh)
+    elif object_type == "empty":
+        created_object = bpy.data.objects.new(name, None)
+        created_object.empty_display_type = 'PLAIN_AXES'
+        created_object.empty_display_size = size
+    else:
+        # 圆环没有对应的bmesh构建函数，仍使用操作符
+        bpy.ops.mesh.primitive_torus_add(major_radius=size/2, minor_radius=size/4, location=location)
+        created_object = bpy.context.active_object
+        created_object.name = name
+    
+    # 操作符已完成定位、链接和选择，其余对象在此添加到场景，并与操作符一样选中并设为活动对象
+    if not created_object.users_collection:
+        created_object.location = location
+        bpy.context.collection.objects.link(created_object)
+        created_object.select_set(True)
+        bpy.context.view_layer.objects.active = created_object
+    
+    return created_object
+
 class CreateObjectHandler(BaseToolHandler):
     """创建3D对象工具处理器"""
     
@@ -33,7 +79,7 @@ class CreateObjectHandler(BaseToolHandler):
                     "type": "string",
                     "title": "对象类型",
                     "description": "要创建的3D对象类型",
-                    "enum": ["cube", "sphere", "plane", "cylinder", "cone", "torus", "empty"]
+                    "enum": list(VALID_OBJECT_TYPES)
                 },
                 "name": {
                     "type": "string",
@@ -64,9 +110,8 @@ class CreateObjectHandler(BaseToolHandler):
         if not object_type:
             return "缺少对象类型参数"
             
-        valid_types = ["cube", "sphere", "plane", "cylinder", "cone", "torus", "empty"]
-        if object_type not in valid_types:
-            return f"无效的对象类型: {object_type}，有效类型: {', '.join(valid_types)}"
+        if object_type not in VALID_OBJECT_TYPES:
+            return f"无效的对象类型: {object_type}，有效类型: {', '.join(VALID_OBJECT_TYPES)}"
             
         # 检查位置参数
         location = arguments.get("location")
@@ -91,28 +136,10 @@ class CreateObjectHandler(BaseToolHandler):
         """在主线程中创建对象"""
         object_type = arguments.get("object_type")
         name = arguments.get("name", f"新{object_type}")
-        location = Vector(arguments.get("location", [0, 0, 0]))
+        location = arguments.get("location", [0, 0, 0])
         size = arguments.get("size", 1.0)
         
-        # 创建对象
-        if object_type == "cube":
-            bpy.ops.mesh.primitive_cube_add(size=size, location=location)
-        elif object_type == "sphere":
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=size/2, location=location)
-        elif object_type == "plane":
-            bpy.ops.mesh.primitive_plane_add(size=size, location=location)
-        elif object_type == "cylinder":
-            bpy.ops.mesh.primitive_cylinder_add(radius=size/2, depth=size, location=location)
-        elif object_type == "cone":
-            bpy.ops.mesh.primitive_cone_add(radius1=size/2, depth=size, location=location)
-        elif object_type == "torus":
-            bpy.ops.mesh.primitive_torus_add(major_radius=size/2, minor_radius=size/4, location=location)
-        elif object_type == "empty":
-            bpy.ops.object.empty_add(type='PLAIN_AXES', radius=size, location=location)
-        
-        # 设置对象名称
-        created_object = bpy.context.active_object
-        created_object.name = name
+        build_object(object_type, name, location, size)
         
         # 创建成功响应
         text_content = self.create_text_content(f"已创建 {object_type} 对象: {name}")
@@ -0,0 +1,119 @@
+"""
+批量创建Blender对象的工具
+"""
+
+from ..registry import register_tool
+import logging
+from typing import Any, Dict, Optional
+
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
+from ....utils import thread_utils
+from .create_object import VALID_OBJECT_TYPES, build_object
+
+# 获取日志器
+logger = logging.getLogger("BlenderMCP.CreateObjects")
+
+class CreateObjectsHandler(BaseToolHandler):
+    """批量创建3D对象工具处理器"""
+    
+    name = "mcp_blender_create_objects"
+    description = "一次创建多个3D对象，所有对象在同一次主线程调用中创建"
+    
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "title": "对象列表",
+                "description": "要创建的对象，每项包含 object_type、name、location、size，含义与 mcp_blender_create_object 相同",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "enum": list(VALID_OBJECT_TYPES)
+                        },
+                        "name": {
+                            "type": "string"
+                        },
+                        "location": {
+                            "type": "array",
+                            "items": {"type": "number"},
+                            "minItems": 3,
+                            "maxItems": 3
+                        },
+                        "size": {
+                            "type": "number"
+                        }
+                    },
+                    "required": ["object_type"]
+                }
+            }
+        },
+        "required": ["items"]
+    }
+        
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
+        """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
+        # 检查对象列表
+        items = arguments.get("items")
+        if not items or not isinstance(items, list):
+            return "必须提供至少一个要创建的对象"
+            
+        for i, item in enumerate(items):
+            if not isinstance(item, dict) or item.get("object_type") not in VALID_OBJECT_TYPES:
+                return f"第 {i + 1} 个对象的类型无效，有效类型: {', '.join(VALID_OBJECT_TYPES)}"
+                
+            location = item.get("location")
+            if location and not (isinstance(location, list) and len(location) == 3 and all(isinstance(v, (int, float)) for v in location)):
+                return f"第 {i + 1} 个对象的位置参数必须是包含3个数字的数组 [x, y, z]"
+                
+            size = item.get("size")
+            if size and not isinstance(size, (int, float)):
+                return f"第 {i + 1} 个对象的尺寸参数必须是数字"
+            
+        return None
+        
+    def execute(self, arguments: Dict[str, Any]) -> Any:
+        """执行批量创建对象操作"""
+        logger.info("批量创建对象，参数: %s", arguments)
+        
+        # 所有对象在同一次主线程调用中创建，只等待一次主线程
+        return thread_utils.run_in_main_thread(self._create_objects, arguments)
+        
+    def _create_objects(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """在主线程中依次创建所有对象"""
+        items = arguments.get("items", [])
+        
+        created = []
+        for i, item in enumerate(items):
+            object_type = item.get("object_type")
+            try:
+                obj = build_object(
+                    object_type,
+                    item.get("name", f"新{object_type}"),
+                    item.get("location", [0, 0, 0]),
+                    item.get("size", 1.0)
+                )
+            except Exception as e:
+                # 已创建的对象保留在场景中，并在错误信息中列出
+                message = f"创建第 {i + 1} 个对象（{object_type}）时出错: {str(e)}"
+                if created:
+                    message += f"\n已创建: {', '.join(created)}"
+                return self.create_error_result(message)
+            created.append(obj.name)
+        
+        # 创建结果信息
+        text_content = self.create_text_content(f"已创建 {len(created)} 个对象: {', '.join(created)}")
+        
+        # 返回结果
+        return self.create_result([text_content])
+
+
+# 在导入时自动注册工具类（首次调用时再实例化）
+register_tool(CreateObjectsHandler)
@@ -74,15 +74,14 @@ class DeleteObjectHandler(BaseToolHandler):
         
         elif obj_name:
             # 删除特定对象
-            if obj_name in bpy.data.objects:
-                obj = bpy.data.objects[obj_name]
-                bpy.data.objects.remove(obj)
-                deleted_objects.append(obj_name)
-                
-                text_content = self.create_text_content(f"已删除对象: {obj_name}")
-            else:
-                text_content = self.create_text_content(f"找不到对象: {obj_name}")
-                return self.create_result([text_content], is_error=True)
+            obj = bpy.data.objects.get(obj_name)
+            if obj is None:
+                return self.create_error_result("找不到对象: {obj_name}", obj_name=obj_name)
+            
+            bpy.data.objects.remove(obj)
+            deleted_objects.append(obj_name)
+            
+            text_content = self.create_text_content(f"已删除对象: {obj_name}")
         
         else:
             text_content = self.create_text_content("未提供对象名称或删除所有标志")
@@ -1,9 +1,10 @@
 from ..registry import register_tool
 import bpy
 import logging
+import mathutils
 from typing import Any, Dict, List, Optional
 
-from ..base_tool_handler import BaseToolHandler
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
 from ....utils import thread_utils
 
 # 获取日志器
@@ -28,7 +29,8 @@ class DuplicateObjectHandler(BaseToolHandler):
                 "name": {
                     "type": "string",
                     "title": "源对象名称",
-                    "description": "要复制的对象名称"
+                    "description": "要复制的对象名称",
+                    "minLength": 1
                 },
                 "new_name": {
                     "type": "string",
@@ -44,10 +46,12 @@ class DuplicateObjectHandler(BaseToolHandler):
                 "offset": {
                     "type": "array",
                     "title": "位置偏移",
-                    "description": "复制对象的位置偏移 [x, y, z]",
+                    "description": "复制对象在世界空间中的位置偏移 [x, y, z]",
                     "items": {
                         "type": "number"
                     },
+                    "minItems": 3,
+                    "maxItems": 3,
                     "default": [1.0, 0.0, 0.0]
                 }
             },
@@ -56,6 +60,10 @@ class DuplicateObjectHandler(BaseToolHandler):
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
         # 检查源对象名称
         if not arguments.get("name"):
             return "必须提供源对象名称"
@@ -81,45 +89,25 @@ class DuplicateObjectHandler(BaseToolHandler):
         linked = arguments.get("linked", False)
         offset = arguments.get("offset", [1.0, 0.0, 0.0])
         
-        # 检查对象是否存在
-        if obj_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {obj_name}")
-            return self.create_result([text_content], is_error=True)
-        
         # 获取原始对象
-        orig_obj = bpy.data.objects[obj_name]
+        orig_obj = bpy.data.objects.get(obj_name)
+        if orig_obj is None:
+            return self.create_error_result("找不到对象: {obj_name}", obj_name=obj_name)
         
-        # 确保所有对象都取消选择
-        bpy.ops.object.select_all(action='DESELECT')
+        # 直接复制数据块，不经过选择和复制操作符
+        new_obj = orig_obj.copy()
+        if not linked and orig_obj.data is not None:
+            new_obj.data = orig_obj.data.copy()
         
-        # 选择要复制的对象
-        orig_obj.select_set(True)
-        bpy.context.view_layer.objects.active = orig_obj
-        
-        # 执行复制
-        if linked:
-            bpy.ops.object.duplicate_move_linked(
-                OBJECT_OT_duplicate={
-                    "linked": True, 
-                    "mode": 'TRANSLATION'
-                },
-                TRANSFORM_OT_translate={
-                    "value": offset
-                }
-            )
-        else:
-            bpy.ops.object.duplicate_move(
-                OBJECT_OT_duplicate={
-                    "linked": False, 
-                    "mode": 'TRANSLATION'
-                },
-                TRANSFORM_OT_translate={
-                    "value": offset
-                }
-            )
+        # 在世界空间中应用位置偏移（有父级时同样按全局坐标移动）
+        matrix = orig_obj.matrix_world.copy()
+        matrix.translation += mathutils.Vector(offset)
+        new_obj.matrix_world = matrix
         
-        # 获取新创建的对象(当前选中的对象即为复制出的对象)
-        new_obj = bpy.context.selected_objects[0]
+        # 添加到原始对象所在的集合
+        collections = orig_obj.users_collection or (bpy.context.collection,)
+        for collection in collections:
+            collection.objects.link(new_obj)
         
         # 如果提供了新名称，则重命名
         if new_name:
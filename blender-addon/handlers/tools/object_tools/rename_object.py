@@ -67,13 +67,10 @@ class RenameObjectHandler(BaseToolHandler):
         old_name = arguments.get("old_name")
         new_name = arguments.get("new_name")
         
-        # 检查对象是否存在
-        if old_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {old_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[old_name]
+        # 获取对象（一次查找，不存在时返回None）
+        obj = bpy.data.objects.get(old_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {old_name}", old_name=old_name)
         
         # 保存原名称
         original_name = obj.name
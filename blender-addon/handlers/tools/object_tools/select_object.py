@@ -82,36 +82,36 @@ class SelectObjectHandler(BaseToolHandler):
         if obj_name and not obj_names:
             obj_names = [obj_name]
         
-        # 先取消所有选择（如果需要）
-        if deselect_first:
-            bpy.ops.object.select_all(action='DESELECT')
-        
+        layer_objects = bpy.context.view_layer.objects
         selected_objects = []
         
         if select_all:
-            # 选择所有对象
+            # 选择所有对象（全选前无需先取消选择）
             bpy.ops.object.select_all(action='SELECT')
             selected_objects = [obj.name for obj in bpy.data.objects]
             
             text_content = self.create_text_content(f"已选择所有对象，共 {len(selected_objects)} 个")
         
         elif obj_names:
-            # 选择指定的对象
-            for name in obj_names:
-                if name in bpy.data.objects:
-                    obj = bpy.data.objects[name]
+            # 只取消当前已选中的对象，无需调用全选操作符遍历整个场景
+            if deselect_first:
+                for obj in list(layer_objects.selected):
+                    obj.select_set(False)
+            
+            # 选择指定的对象（去除重复名称，只查找当前视图层中的对象）
+            for name in dict.fromkeys(obj_names):
+                obj = layer_objects.get(name)
+                if obj is not None:
                     obj.select_set(True)
                     selected_objects.append(name)
             
             if selected_objects:
                 # 设置活动对象
-                if selected_objects[0] in bpy.data.objects:
-                    bpy.context.view_layer.objects.active = bpy.data.objects[selected_objects[0]]
+                layer_objects.active = layer_objects[selected_objects[0]]
                 
                 text_content = self.create_text_content(f"已选择 {len(selected_objects)} 个对象")
             else:
-                text_content = self.create_text_content("未找到指定的对象")
-                return self.create_result([text_content], is_error=True)
+                return self.create_error_result("未找到指定的对象")
         
         else:
             text_content = self.create_text_content("未提供对象名称或选择所有标志")
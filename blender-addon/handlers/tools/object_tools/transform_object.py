@@ -5,10 +5,9 @@
 import bpy
 from ..registry import register_tool
 import logging
-import mathutils
 from typing import Any, Dict, List, Optional
 
-from ..base_tool_handler import BaseToolHandler
+from ..base_tool_handler import BaseToolHandler, HAS_SCHEMA_VALIDATOR
 from ....utils import thread_utils
 
 # 获取日志器
@@ -33,7 +32,8 @@ class TransformObjectHandler(BaseToolHandler):
                 "name": {
                     "type": "string",
                     "title": "对象名称",
-                    "description": "要变换的对象名称"
+                    "description": "要变换的对象名称",
+                    "minLength": 1
                 },
                 "location": {
                     "type": "array",
@@ -41,7 +41,9 @@ class TransformObjectHandler(BaseToolHandler):
                     "description": "对象的位置坐标 [x, y, z]",
                     "items": {
                         "type": "number"
-                    }
+                    },
+                    "minItems": 3,
+                    "maxItems": 3
                 },
                 "rotation": {
                     "type": "array",
@@ -49,7 +51,9 @@ class TransformObjectHandler(BaseToolHandler):
                     "description": "对象的旋转角度（弧度）[x, y, z]",
                     "items": {
                         "type": "number"
-                    }
+                    },
+                    "minItems": 3,
+                    "maxItems": 3
                 },
                 "scale": {
                     "type": "array",
@@ -57,7 +61,9 @@ class TransformObjectHandler(BaseToolHandler):
                     "description": "对象的缩放值 [x, y, z]",
                     "items": {
                         "type": "number"
-                    }
+                    },
+                    "minItems": 3,
+                    "maxItems": 3
                 },
                 "relative": {
                     "type": "boolean",
@@ -71,6 +77,10 @@ class TransformObjectHandler(BaseToolHandler):
         
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """验证工具参数"""
+        # 优先使用预编译的模式验证器
+        if HAS_SCHEMA_VALIDATOR:
+            return self.validate_schema(arguments)
+            
         # 检查对象名称
         if not arguments.get("name"):
             return "必须提供对象名称"
@@ -98,54 +108,51 @@ class TransformObjectHandler(BaseToolHandler):
         return thread_utils.run_in_main_thread(self._transform_object, arguments)
         
     def _transform_object(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """在主线程中变换对象"""
+        """在主线程中变换对象（属性写入会标记依赖图，由Blender在下次重绘时更新）"""
         obj_name = arguments.get("name")
         location = arguments.get("location")
         rotation = arguments.get("rotation")
         scale = arguments.get("scale")
         relative = arguments.get("relative", False)
         
-        # 检查对象是否存在
-        if obj_name not in bpy.data.objects:
-            text_content = self.create_text_content(f"找不到对象: {obj_name}")
-            return self.create_result([text_content], is_error=True)
-        
-        # 获取对象
-        obj = bpy.data.objects[obj_name]
+        # 获取对象（一次查找，不存在时返回None）
+        obj = bpy.data.objects.get(obj_name)
+        if obj is None:
+            return self.create_error_result("找不到对象: {obj_name}", obj_name=obj_name)
         
-        # 应用变换
+        # 应用变换（RNA向量属性可直接接收三元组，无需构造mathutils对象）
         if location:
             if relative:
-                # 相对位移
-                obj.location.x += location[0]
-                obj.location.y += location[1]
-                obj.location.z += location[2]
+                # 相对位移，原地修改不创建新向量
+                loc = obj.location
+                loc[0] += location[0]
+                loc[1] += location[1]
+                loc[2] += location[2]
             else:
                 # 绝对位置
-                obj.location = mathutils.Vector(location)
+                obj.location = location
         
         if rotation:
             if relative:
                 # 相对旋转
-                obj.rotation_euler.x += rotation[0]
-                obj.rotation_euler.y += rotation[1]
-                obj.rotation_euler.z += rotation[2]
+                rot = obj.rotation_euler
+                rot[0] += rotation[0]
+                rot[1] += rotation[1]
+                rot[2] += rotation[2]
             else:
                 # 绝对旋转
-                obj.rotation_euler = mathutils.Euler(rotation)
+                obj.rotation_euler = rotation
         
         if scale:
             if relative:
                 # 相对缩放
-                obj.scale.x *= scale[0]
-                obj.scale.y *= scale[1]
-                obj.scale.z *= scale[2]
+                scl = obj.scale
+                scl[0] *= scale[0]
+                scl[1] *= scale[1]
+                scl[2] *= scale[2]
             else:
                 # 绝对缩放
-                obj.scale = mathutils.Vector(scale)
-        
-        # 更新场景
-        bpy.context.view_layer.update()
+                obj.scale = scale
         
         # 创建结果信息
         text_content = self.create_text_content(f"已变换对象: {obj_name}")
@@ -1,7 +1,5 @@
 import logging
-from typing import Dict, Any, List, Optional
-import os
-import importlib
+from typing import Dict, Any, List, Optional, Type, Union
 
 from .base_tool_handler import BaseToolHandler, ToolsRegistryMixin
 
@@ -15,8 +13,14 @@ class ToolRegistry(ToolsRegistryMixin):
     def __init__(self):
         """初始化工具注册表"""
         super().__init__()
+        self._schemas_cache: Optional[List[Dict[str, Any]]] = None
         self._register_default_tools()
         
+    def _invalidate_tool_caches(self) -> None:
+        """工具集合变化后清除缓存的工具列表和模式定义"""
+        super()._invalidate_tool_caches()
+        self._schemas_cache = None
+        
     def _register_default_tools(self):
         """注册默认工具"""
         # 导入工具模块（工具将在导入时自动注册）
@@ -73,16 +77,18 @@ class ToolRegistry(ToolsRegistryMixin):
         获取所有工具的模式定义
         
         Returns:
-            工具模式定义列表
+            工具模式定义列表（缓存的列表，调用方不应修改）
         """
-        schemas = []
-        for name, handler in self._tools.items():
-            schemas.append({
-                "name": name,
-                "description": handler.description or "",
-                "inputSchema": handler.input_schema
-            })
-        return schemas
+        if self._schemas_cache is None:
+            self._schemas_cache = [
+                {
+                    "name": name,
+                    "description": self._get_tool_attr(name, "description") or "",
+                    "inputSchema": self._get_tool_attr(name, "input_schema")
+                }
+                for name in self._tools
+            ]
+        return self._schemas_cache
 
 # 全局工具注册表实例
 _tool_registry = None
@@ -112,12 +118,12 @@ def ensure_initialized() -> None:
     if not _initialized:
         get_tool_registry()
 
-def register_tool(handler: BaseToolHandler) -> None:
+def register_tool(handler: Union[BaseToolHandler, Type[BaseToolHandler]]) -> None:
     """
     注册工具处理器到全局注册表
     
     Args:
-        handler: 工具处理器实例
+        handler: 工具处理器实例，或工具处理器类（首次使用时再实例化）
     """
     registry = get_tool_registry()
     registry.register_tool(handler)
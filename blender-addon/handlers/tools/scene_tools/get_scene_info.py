@@ -52,6 +52,12 @@ class GetSceneInfoHandler(BaseToolHandler):
                     "title": "包含世界",
                     "description": "是否包含场景的世界环境信息",
                     "default": True
+                },
+                "include_visibility": {
+                    "type": "boolean",
+                    "title": "计算实际可见性",
+                    "description": "是否通过视图层计算对象的实际可见性（含集合隐藏）；为false时只读取对象在当前视图层的隐藏状态（眼睛图标）",
+                    "default": True
                 }
             }
         }
@@ -78,6 +84,7 @@ class GetSceneInfoHandler(BaseToolHandler):
         include_objects = arguments.get("include_objects", True)
         include_materials = arguments.get("include_materials", False)
         include_world = arguments.get("include_world", True)
+        include_visibility = arguments.get("include_visibility", True)
         
         # 获取场景
         if scene_name:
@@ -112,10 +119,12 @@ class GetSceneInfoHandler(BaseToolHandler):
                 obj_info = {
                     "name": obj.name,
                     "type": obj.type,
-                    "location": [obj.location.x, obj.location.y, obj.location.z],
-                    "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-                    "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-                    "visible": obj.visible_get()
+                    # 每个向量属性只读取一次，由切片一次转换为元组
+                    "location": obj.location[:],
+                    "rotation": obj.rotation_euler[:],
+                    "scale": obj.scale[:],
+                    # visible_get需要沿视图层和集合层级解析，关闭时只读取对象自身的隐藏状态
+                    "visible": obj.visible_get() if include_visibility else not obj.hide_get()
                 }
                 
                 # 特定类型的附加信息
@@ -138,7 +147,7 @@ class GetSceneInfoHandler(BaseToolHandler):
                     obj_info["light"] = {
                         "type": obj.data.type,
                         "energy": obj.data.energy,
-                        "color": [obj.data.color.r, obj.data.color.g, obj.data.color.b]
+                        "color": obj.data.color[:]
                     }
                     
                 objects_info.append(obj_info)
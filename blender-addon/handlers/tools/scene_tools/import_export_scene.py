@@ -348,7 +348,8 @@ class ExportSceneHandler(BaseToolHandler):
         bpy.context.window.scene = scene
         
         # 保存当前选择状态
-        original_selected = [obj for obj in bpy.data.objects if obj.select_get()]
+        # 视图层已维护选中对象集合，无需遍历 bpy.data.objects 逐个查询
+        original_selected = list(bpy.context.view_layer.objects.selected)
         
         try:
             # 准备要导出的对象
@@ -359,7 +360,7 @@ class ExportSceneHandler(BaseToolHandler):
                 export_objects = [bpy.data.objects[name] for name in object_names if name in bpy.data.objects]
             elif selected_only:
                 # 使用当前选中的对象
-                export_objects = [obj for obj in bpy.context.selected_objects]
+                export_objects = original_selected
             else:
                 # 使用场景中的所有对象
                 export_objects = [obj for obj in scene.objects]
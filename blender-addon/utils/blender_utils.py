@@ -1,4 +1,6 @@
 import bpy
+import bmesh
+import contextlib
 import os
 import json
 
@@ -114,3 +116,19 @@ def export_scene_json(filepath):
         json.dump(scene_data, f, indent=2)
         
     return filepath
+
+@contextlib.contextmanager
+def edit_bmesh(obj):
+    """
+    获取对象编辑网格的bmesh（对象需处于编辑模式），退出时同步到网格
+    
+    参数:
+        obj: 网格对象
+    """
+    bm = bmesh.from_edit_mesh(obj.data)
+    try:
+        yield bm
+    finally:
+        # 出错时bmesh上已做的修改同样属于编辑网格，照常同步
+        if bm.is_valid:
+            bmesh.update_edit_mesh(obj.data)
@@ -1,6 +1,6 @@
 import bpy
+import contextlib
 import threading
-import time
 import queue
 
 from ..logger import get_logger
@@ -10,65 +10,81 @@ logger = get_logger("BlenderMCP.ThreadUtils")
 
 # 用于主线程执行的命令队列
 command_queue = queue.Queue()
-result_queue = queue.Queue()
+
+def _call(func, args, kwargs):
+    """执行函数，出错时返回错误字典"""
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.error("在主线程执行函数时出错: %s", e)
+        return {"error": str(e)}
 
 def run_in_main_thread(func, *args, **kwargs):
     """将函数放入队列，等待在主线程中执行"""
-    # 创建唯一ID
-    command_id = str(time.time())
-    event = threading.Event()
+    # 已在主线程中（如批量工具内部调用其他工具）时直接执行，避免主线程等待自身
+    if threading.current_thread() is threading.main_thread():
+        return _call(func, args, kwargs)
     
-    # 放入命令队列
-    command_queue.put({
-        "id": command_id,
+    # 执行结果直接写回命令本身，多个线程同时等待时不会取走彼此的结果
+    command = {
         "function": func,
         "args": args,
         "kwargs": kwargs,
-        "event": event
-    })
+        "event": threading.Event(),
+        "result": None
+    }
+    command_queue.put(command)
     
     # 等待执行完成
-    event.wait()
-    
-    # 获取结果
-    while not result_queue.empty():
-        result = result_queue.get()
-        if result["id"] == command_id:
-            return result["result"]
+    command["event"].wait()
+    return command["result"]
+
+# 批量调用的嵌套深度，以及批次结束时需要执行的收尾回调（只在主线程中访问）
+_batch_depth = 0
+_batch_end_callbacks = []
+
+@contextlib.contextmanager
+def batch_scope():
+    """标记一次批量调用，最外层批次退出时依次执行登记的收尾回调"""
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            callbacks = list(_batch_end_callbacks)
+            _batch_end_callbacks.clear()
+            for callback in callbacks:
+                _call(callback, (), {})
+
+def call_at_batch_end(callback):
+    """
+    在当前批量调用结束时执行回调，同一回调只登记一次
     
-    return None
+    不在批量调用中时立即执行，保证回调不会被遗留
+    """
+    if _batch_depth == 0:
+        callback()
+    elif callback not in _batch_end_callbacks:
+        _batch_end_callbacks.append(callback)
 
 def process_command_queue():
     """处理命令队列，在主线程计时器中调用"""
     if command_queue.empty():
         return 1.0  # 如果队列为空，1秒后再次检查
     
-    try:
-        # 获取命令
-        command = command_queue.get(block=False)
-        
-        # 执行函数
-        func = command["function"]
-        args = command["args"]
-        kwargs = command["kwargs"]
-        
+    # 每次回调执行完所有已排队的命令，突发的多个调用无需各自等待一个计时器周期
+    while True:
         try:
-            result = func(*args, **kwargs)
-        except Exception as e:
-            logger.error(f"在主线程执行函数时出错: {str(e)}")
-            result = {"error": str(e)}
+            command = command_queue.get(block=False)
+        except queue.Empty:
+            break
         
-        # 返回结果
-        result_queue.put({
-            "id": command["id"],
-            "result": result
-        })
+        command["result"] = _call(command["function"], command["args"], command["kwargs"])
         
         # 设置事件，通知等待线程
         command["event"].set()
-        
-    except queue.Empty:
-        pass
     
     return 0.1  # 0.1秒后再次检查队列
 